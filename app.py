@@ -7,17 +7,27 @@ import asyncio
 import subprocess
 import shutil
 import contextlib
+import functools
+import gzip
+import http.client
+import hashlib
+import heapq
 import re
 import time
 import sqlite3
+import ssl
+import queue
 import tarfile
 import zipfile
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI, Request, Depends, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
@@ -73,12 +83,28 @@ _OLD_WORLD_CONFIG = SERVER_DIR / "universe" / "worlds" / "default" / "config.jso
 WORLD_CONFIG_FILE = _NEW_WORLD_CONFIG if _NEW_WORLD_CONFIG.exists() else _OLD_WORLD_CONFIG
 SERVER_CONFIG_FILE = SERVER_DIR / "config.json"
 PLAYER_NAME_RE = re.compile(r"^[A-Za-z0-9_-]{3,32}$")
+_VIEW_RADIUS_RE = re.compile(r"(?:Initial view radius is|View radius.*?to) (\d+)")
+_TPS_VR_RE = re.compile(
+    r"Setting TPS of world \w+ to (?P<tps>\d+)"
+    r"|(?:Initial view radius is|View radius.*?to) (?P<vr>\d+)"
+)
+# Join and leave events in one pattern, scanned over the whole journal dump
+# (-o short-iso, so every line starts with its ISO timestamp).
+_PLAYER_EVENT_RE = re.compile(
+    r"^(?P<ts>\S+T\S+)(?:"
+    r".*Adding player '(?P<jname>[^'\n]+)' to world '(?P<world>[^'\n]+)' at location .+\((?P<juuid>[a-f0-9-]+)\)"
+    r"|.*Removing player '(?P<lname>[^'\n]+?)(?:[ \t]*\([^)\n]+\))?'.*\((?P<luuid>[a-f0-9-]+)\)[ \t]*$"
+    r")",
+    re.MULTILINE,
+)
+_CHAT_RE = re.compile(r"(\S+T\S+).*<([^>]+)> (.+)")
 
 # ---------------------------------------------------------------------------
 # Runtime Configuration (persisted settings)
 # ---------------------------------------------------------------------------
 DASHBOARD_CONFIG_FILE = SERVER_DIR / ".dashboard_config.json"
 _config_cache = None
+_config_mtime_ns: int | None = None
 from threading import Lock
 _config_lock = Lock()
 _backup_seed_cache_lock = Lock()
@@ -86,54 +112,98 @@ _backup_seed_cache: dict[str, dict] = {}
 _backup_seed_db_lock = Lock()
 _backup_seed_db_ready = False
 _backup_seed_db_disabled = False
+_SEED_ANALYZE_MIN_ROWS = 8
 
 
 def load_config() -> dict:
-    """Load runtime configuration from file."""
-    global _config_cache
+    """Load runtime configuration from file.
+
+    The parsed file is cached and invalidated by its mtime, so saves from
+    other workers are picked up and a cache hit costs a single stat().
+    """
+    global _config_cache, _config_mtime_ns
 
     default_config = {
         "cf_api_key": _CF_API_KEY_ENV,
     }
 
+    try:
+        mtime_ns = os.stat(DASHBOARD_CONFIG_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    cached = _config_cache
+    if cached is not None and mtime_ns == _config_mtime_ns:
+        return {**default_config, **cached}
+
     with _config_lock:
-        if _config_cache is not None:
-            merged = {**default_config, **_config_cache}
-            return merged
+        if _config_cache is not None and mtime_ns == _config_mtime_ns:
+            return {**default_config, **_config_cache}
 
-        if DASHBOARD_CONFIG_FILE.exists():
+        if mtime_ns is not None:
             try:
                 with open(DASHBOARD_CONFIG_FILE, "r") as f:
                     _config_cache = json.load(f)
-                merged = {**default_config, **_config_cache}
-                return merged
+                _config_mtime_ns = mtime_ns
+                return {**default_config, **_config_cache}
             except (json.JSONDecodeError, PermissionError, OSError):
                 pass
 
         _config_cache = default_config
+        _config_mtime_ns = mtime_ns
         return default_config
 
 
 def save_config(config: dict) -> bool:
     """Save runtime configuration to file."""
-    global _config_cache
+    global _config_cache, _config_mtime_ns
 
+    data = json.dumps(config, indent=2).encode()
+    tmp_path = DASHBOARD_CONFIG_FILE.with_name(DASHBOARD_CONFIG_FILE.name + ".tmp")
     with _config_lock:
         try:
             DASHBOARD_CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(DASHBOARD_CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=2)
+            try:
+                mode = os.stat(DASHBOARD_CONFIG_FILE).st_mode & 0o777
+            except FileNotFoundError:
+                mode = None
+            # Write a sibling and rename it over the file, so a crash mid-save
+            # never leaves a truncated config behind
+            with open(tmp_path, "wb") as f:
+                if mode is not None:
+                    os.fchmod(f.fileno(), mode)  # it holds the API key
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, DASHBOARD_CONFIG_FILE)
             _config_cache = config
+            _config_mtime_ns = os.stat(DASHBOARD_CONFIG_FILE).st_mtime_ns
+            _cf_api_key_cache["ts"] = None
             return True
         except (PermissionError, OSError) as e:
+            tmp_path.unlink(missing_ok=True)
             print(f"[Dashboard] Failed to save config: {e}")
             return False
 
 
+_CF_API_KEY_TTL = 5.0
+_cf_api_key_cache = {"key": None, "ts": None}
+
+
 def get_cf_api_key() -> str:
-    """Get CurseForge API key (from config or env)."""
-    config = load_config()
-    return config.get("cf_api_key", "")
+    """Get CurseForge API key (from config or env).
+
+    Memoized: save_config() drops the value, and the short TTL still picks
+    up edits made to the file by hand.
+    """
+    now = time.monotonic()
+    ts = _cf_api_key_cache["ts"]
+    if ts is not None and now - ts < _CF_API_KEY_TTL:
+        return _cf_api_key_cache["key"]
+    key = load_config().get("cf_api_key", "")
+    _cf_api_key_cache["key"] = key
+    _cf_api_key_cache["ts"] = now
+    return key
 
 # Security: Maximum command length to prevent buffer overflow attempts
 MAX_COMMAND_LENGTH = 500
@@ -149,6 +219,14 @@ BLOCKED_CONSOLE_COMMANDS = {
 # Quotes and tabs are blocked as they could be used in injection attempts and
 # are not needed for legitimate Hytale console commands
 SHELL_METACHARACTERS = set(';&|`$()<>\\\n\r')
+# Other C0 control characters (tabs, escapes, NUL, ...) and DEL have no place
+# in a console command either
+CONTROL_CHARACTERS = set(map(chr, range(0x20))) | {"\x7f"}
+# One precompiled character class covers both sets, so the check runs as a
+# single C-level scan; the matched character picks the error message
+_FORBIDDEN_CHAR_RE = re.compile(
+    "[" + re.escape("".join(sorted(SHELL_METACHARACTERS | CONTROL_CHARACTERS))) + "]"
+)
 
 # Security: Dangerous command patterns that could harm the host system
 # Using word boundaries (\b) to avoid false positives on substrings
@@ -184,6 +262,27 @@ DANGEROUS_PATTERNS = [
     re.compile(r'\bservice\b'), # Service control
 ]
 
+# DANGEROUS_PATTERNS split into two fused alternations so a command costs two
+# C-level searches instead of one per pattern. The \bword\b entries share a
+# single \b(...)\b group whose match is looked up in _DANGEROUS_WORDS; each
+# path pattern gets its own group and lastindex maps a hit back to its entry
+# for the error message. Folding both into one regex measured ~4x slower (the
+# word branch loses re's literal prefix scan), so they stay separate and the
+# path scan only runs when the command contains a "/".
+_DANGEROUS_WORDS: dict[str, re.Pattern] = {}
+_DANGEROUS_PATH_PATTERNS: list[re.Pattern] = []
+for _pattern in DANGEROUS_PATTERNS:
+    _word = re.fullmatch(r"\\b(\w+)\\b", _pattern.pattern)
+    if _word:
+        _DANGEROUS_WORDS[_word.group(1)] = _pattern
+    else:
+        _DANGEROUS_PATH_PATTERNS.append(_pattern)
+del _pattern, _word
+_DANGEROUS_PATH_RE = re.compile("|".join(f"({p.pattern})" for p in _DANGEROUS_PATH_PATTERNS))
+_DANGEROUS_WORD_RE = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, _DANGEROUS_WORDS), key=len, reverse=True)) + r")\b"
+)
+
 # ---------------------------------------------------------------------------
 # App Setup
 # ---------------------------------------------------------------------------
@@ -202,18 +301,55 @@ async def startup_event():
         # Import here to avoid circular reference
         global _players_cache, _perf_cache
         try:
-            loop = asyncio.get_event_loop()
             # Warm player cache in background
-            _players_cache["data"] = await loop.run_in_executor(None, _get_players_data)
+            _players_cache["data"] = await run_blocking(_get_players_data)
             _players_cache["ts"] = time.time()
+            _players_cache["body"] = None
             # Warm performance cache
-            _perf_cache["data"] = await loop.run_in_executor(None, _get_perf_data)
+            _perf_cache["data"] = await run_blocking(_get_perf_data)
             _perf_cache["ts"] = time.time()
         except Exception:
             pass  # Ignore errors during warmup
     asyncio.create_task(warm_caches())
 
 
+def _json_body(data) -> tuple[bytes, str]:
+    """Encode data like JSONResponse does and derive a weak ETag from it."""
+    body = json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore W/ prefixes
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in header.split(","))
+
+
+def _etag_response(request: Request, body: bytes, etag: str,
+                   media_type: str = "application/json") -> Response:
+    """Serve body with an ETag, or an empty 304 if the client already has it."""
+    headers = {"ETag": etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+async def _config_file_response(request: Request, path: Path) -> Response:
+    """Return {"content": ...} for a config file, keyed by its mtime and size."""
+    st = await run_blocking(path.stat)
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if _etag_matches(request, etag):
+        # Unchanged on disk: skip the read entirely
+        return Response(status_code=304, headers={"ETag": etag})
+    content = await run_blocking(path.read_text)
+    return JSONResponse({"content": content}, headers={"ETag": etag})
+
+
 def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
     correct_user = secrets.compare_digest(credentials.username, DASH_USER)
     correct_pass = secrets.compare_digest(credentials.password, DASH_PASS)
@@ -229,18 +365,38 @@ def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-# Thread pool for non-blocking subprocess calls
-_executor = ThreadPoolExecutor(max_workers=4)
+# Shared read end of /dev/null for child stdin (avoids an open() per spawn)
+_DEVNULL_FD = os.open(os.devnull, os.O_RDONLY)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_executable(name: str) -> str:
+    """Resolve a command name to an absolute path (cached)."""
+    if os.path.dirname(name):
+        return name
+    return shutil.which(name) or name
+
+
+def _cmd_output(stdout: bytes, stderr: bytes) -> str:
+    """Decode captured stdout/stderr into run_cmd's combined output string."""
+    output = stdout.decode("utf-8", errors="replace")
+    if stderr:
+        output += "\n" + stderr.decode("utf-8", errors="replace")
+    return output.strip()
 
 
 def run_cmd(cmd: list[str], timeout: int = 10) -> tuple[str, int]:
     """Run a subprocess and return (stdout+stderr, returncode)."""
+    # An absolute executable path plus close_fds=False keeps CPython on the
+    # posix_spawn fast path. Our own fds are non-inheritable (PEP 446), so
+    # nothing leaks into the child.
+    argv = [_resolve_executable(cmd[0]), *cmd[1:]] if cmd else cmd
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        output = result.stdout
-        if result.stderr:
-            output += "\n" + result.stderr
-        return output.strip(), result.returncode
+        result = subprocess.run(
+            argv, stdin=_DEVNULL_FD, capture_output=True,
+            close_fds=False, timeout=timeout,
+        )
+        return _cmd_output(result.stdout, result.stderr), result.returncode
     except subprocess.TimeoutExpired:
         return "Command timed out", 1
     except FileNotFoundError:
@@ -249,10 +405,36 @@ def run_cmd(cmd: list[str], timeout: int = 10) -> tuple[str, int]:
         return str(e), 1
 
 
+def run_blocking(func, *args):
+    """Run a blocking call on the loop's default executor.
+
+    Same as asyncio.to_thread for positional args, minus the per-call
+    contextvars copy and functools.partial; nothing here uses ContextVars.
+    """
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 async def run_cmd_async(cmd: list[str], timeout: int = 10) -> tuple[str, int]:
-    """Async version of run_cmd using thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, run_cmd, cmd, timeout)
+    """Async version of run_cmd: the event loop waits on the child, no thread."""
+    argv = [_resolve_executable(cmd[0]), *cmd[1:]] if cmd else cmd
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv, stdin=_DEVNULL_FD,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
+        )
+    except FileNotFoundError:
+        return f"Command not found: {cmd[0]}", 1
+    except Exception as e:
+        return str(e), 1
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        return "Command timed out", 1
+    return _cmd_output(stdout, stderr), proc.returncode
 
 
 def with_optional_sudo(cmd: list[str]) -> list[str]:
@@ -271,6 +453,36 @@ def human_size(size_bytes: float) -> str:
     return f"{size_bytes:.1f} PB"
 
 
+def _ttl_cache(seconds: float):
+    """Cache a zero-argument function's result for a few seconds.
+
+    The wrapped function gets a cache_clear() to drop the value early.
+    """
+    def decorator(fn):
+        cache = {"value": None, "ts": None}
+        lock = Lock()
+
+        @functools.wraps(fn)
+        def wrapper():
+            now = time.monotonic()
+            with lock:
+                if cache["ts"] is not None and now - cache["ts"] < seconds:
+                    return cache["value"]
+            value = fn()
+            with lock:
+                cache["value"] = value
+                cache["ts"] = now
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                cache["ts"] = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
 def get_service_status() -> dict:
     """Query service status (systemd or Docker)."""
     if DOCKER_MODE and HYTALE_CONTAINER:
@@ -329,15 +541,76 @@ def get_logs() -> list[str]:
     return output.splitlines()
 
 
-def get_db_connection():
+_db_exists = False
+# Pooled connections: readers are opened read-only and reused, the single
+# writer is serialized by a lock. Both cross threads via run_blocking.
+DB_READER_POOL_SIZE = 4
+_db_readers: queue.SimpleQueue = queue.SimpleQueue()
+_db_writer: sqlite3.Connection | None = None
+_db_writer_lock = Lock()
+
+
+def get_db_connection(readonly: bool = False):
     """Get a SQLite connection with proper settings."""
-    if not DB_PATH.exists():
-        return None
-    conn = sqlite3.connect(DB_PATH, timeout=5)
+    global _db_exists
+    # The worker creates the DB once and it never goes away at runtime, so
+    # only a negative answer needs re-checking (first boot before the worker).
+    if not _db_exists:
+        if not DB_PATH.exists():
+            return None
+        _db_exists = True
+    if readonly:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, timeout=5, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(DB_PATH, timeout=5, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    # The worker already put the DB in WAL mode (persistent); these are
+    # per-connection settings. With WAL, NORMAL sync skips the fsync on
+    # every seed-cache commit without risking corruption.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+@contextlib.contextmanager
+def db_reader():
+    """Borrow a pooled read-only connection (None if the DB does not exist)."""
+    try:
+        conn = _db_readers.get_nowait()
+    except queue.Empty:
+        conn = get_db_connection(readonly=True)
+    if conn is None:
+        yield None
+        return
+    try:
+        yield conn
+    except BaseException:
+        conn.close()
+        raise
+    if conn.in_transaction:
+        conn.rollback()
+    if _db_readers.qsize() < DB_READER_POOL_SIZE:
+        _db_readers.put(conn)
+    else:
+        conn.close()
+
+
+@contextlib.contextmanager
+def db_writer():
+    """Hold the shared writer connection (None if the DB does not exist)."""
+    global _db_writer
+    with _db_writer_lock:
+        if _db_writer is None:
+            _db_writer = get_db_connection()
+        conn = _db_writer
+        try:
+            yield conn
+        finally:
+            # Never hand the next caller a half-finished transaction
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+
+
 def get_performance_from_db() -> dict:
     """Get latest performance metrics from SQLite database."""
     result = {
@@ -349,143 +622,145 @@ def get_performance_from_db() -> dict:
         "mode": "sqlite"
     }
 
-    conn = get_db_connection()
-    if not conn:
-        # Fallback to log parsing if DB not available
-        return get_tps_from_logs_fallback()
-
-    try:
-        c = conn.cursor()
-        c.execute("""
-            SELECT tps, cpu_percent, ram_mb, ram_percent, view_radius
-            FROM performance
-            ORDER BY timestamp DESC
-            LIMIT 1
-        """)
-        row = c.fetchone()
-        if row:
-            result["tps"] = row["tps"]
-            result["cpu_percent"] = row["cpu_percent"]
-            result["ram_mb"] = row["ram_mb"]
-            result["ram_percent"] = row["ram_percent"]
-            result["view_radius"] = row["view_radius"]
-    except Exception as e:
-        print(f"DB error: {e}")
-    finally:
-        conn.close()
+    with db_reader() as conn:
+        if not conn:
+            # Fallback to log parsing if DB not available
+            return get_tps_from_logs_fallback()
+
+        try:
+            c = conn.cursor()
+            c.execute("""
+                SELECT tps, cpu_percent, ram_mb, ram_percent, view_radius
+                FROM performance
+                ORDER BY timestamp DESC
+                LIMIT 1
+            """)
+            row = c.fetchone()
+            if row:
+                result["tps"] = row["tps"]
+                result["cpu_percent"] = row["cpu_percent"]
+                result["ram_mb"] = row["ram_mb"]
+                result["ram_percent"] = row["ram_percent"]
+                result["view_radius"] = row["view_radius"]
+        except Exception as e:
+            print(f"DB error: {e}")
 
     return result
 
 
 def get_players_from_db() -> dict:
     """Get player list from SQLite database."""
-    conn = get_db_connection()
-    if not conn:
-        # Fallback to log parsing if DB not available
-        return get_players_from_logs_fallback()
-
-    try:
-        c = conn.cursor()
-        c.execute("""
-            SELECT uuid, name, online, last_login, last_logout, world
-            FROM players
-            ORDER BY last_login DESC
-        """)
-        rows = c.fetchall()
-        players = []
-        for row in rows:
-            players.append({
-                "uuid": row["uuid"],
-                "name": row["name"],
-                "online": bool(row["online"]),
-                "last_login": row["last_login"],
-                "last_logout": row["last_logout"],
-                "world": row["world"],
-                "position": None
-            })
-        return {"players": players, "ops": get_ops_list()}
-    except Exception as e:
-        print(f"DB error: {e}")
-        return {"players": [], "error": str(e)}
-    finally:
-        conn.close()
+    with db_reader() as conn:
+        if not conn:
+            # Fallback to log parsing if DB not available
+            return get_players_from_logs_fallback()
+
+        try:
+            c = conn.cursor()
+            c.row_factory = None  # plain tuples: positional access skips Row lookups
+            c.execute("""
+                SELECT uuid, name, online, last_login, last_logout, world
+                FROM players
+                ORDER BY last_login DESC
+            """)
+            players = [
+                {
+                    "uuid": r[0],
+                    "name": r[1],
+                    "online": bool(r[2]),
+                    "last_login": r[3],
+                    "last_logout": r[4],
+                    "world": r[5],
+                    "position": None,
+                }
+                for r in c.fetchall()
+            ]
+        except Exception as e:
+            print(f"DB error: {e}")
+            return {"players": [], "error": str(e)}
+    return {"players": players, "ops": get_ops_list()}
+
+
+def get_player_counts() -> tuple[int, int]:
+    """Return (online, total) player counts without building player records."""
+    with db_reader() as conn:
+        if not conn:
+            players = get_players_from_logs_fallback().get("players", [])
+            return sum(1 for p in players if p.get("online")), len(players)
+
+        try:
+            c = conn.cursor()
+            c.execute("SELECT COALESCE(SUM(online != 0), 0), COUNT(*) FROM players")
+            online, total = c.fetchone()
+            return int(online), int(total)
+        except Exception as e:
+            print(f"DB error: {e}")
+            return 0, 0
 
 
 def get_performance_history(hours: int = 1) -> list:
     """Get performance history for graphs."""
-    conn = get_db_connection()
-    if not conn:
-        return []
+    with db_reader() as conn:
+        if not conn:
+            return []
 
-    try:
-        c = conn.cursor()
-        c.execute("""
-            SELECT timestamp, tps, cpu_percent, ram_mb, players_online
-            FROM performance
-            WHERE strftime(
-                '%s',
-                replace(substr(timestamp, 1, 19), 'T', ' ')
-            ) > strftime('%s', 'now', ? || ' hours')
-            ORDER BY timestamp ASC
-        """, (f"-{hours}",))
-        return [dict(row) for row in c.fetchall()]
-    except Exception:
-        return []
-    finally:
-        conn.close()
+        try:
+            c = conn.cursor()
+            # Timestamps are UTC ISO-8601 strings; a plain comparison lets the
+            # worker's idx_perf_ts_cov answer this with an index range scan
+            cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
+            c.execute("""
+                SELECT timestamp, tps, cpu_percent, ram_mb, players_online
+                FROM performance
+                WHERE timestamp > ?
+                ORDER BY timestamp ASC
+            """, (cutoff,))
+            return [dict(row) for row in c.fetchall()]
+        except Exception:
+            return []
 
 
 def get_view_radius_from_logs() -> int | None:
     """Get view radius from logs (quick check)."""
-    cmd = ["journalctl", "-u", "hytale", "-n100", "--no-pager", "-q"]
+    cmd = ["journalctl", "-u", "hytale", "-n100", "--no-pager", "-q", "-o", "cat"]
     output, rc = run_cmd(cmd, timeout=5)
     if rc != 0:
         return None
 
-    vr_re = re.compile(r"(?:Initial view radius is|View radius.*?to) (\d+)")
-    for line in reversed(output.splitlines()):
-        match = vr_re.search(line)
-        if match:
-            return int(match.group(1))
-    return None
+    view_radius = None
+    for match in _VIEW_RADIUS_RE.finditer(output):
+        view_radius = match.group(1)
+    return int(view_radius) if view_radius is not None else None
 
 
 def get_tps_from_logs_fallback() -> dict:
     """Fallback: Parse TPS from logs if DB not available."""
-    cmd = ["journalctl", "-u", "hytale", "-n500", "--no-pager", "-q"]
+    cmd = ["journalctl", "-u", "hytale", "-n500", "--no-pager", "-q", "-o", "cat"]
     output, rc = run_cmd(cmd, timeout=10)
     if rc != 0:
         return {"tps": None, "view_radius": None}
 
+    # Single pass over the whole blob; the last match of each group wins.
     tps = None
     view_radius = None
-    tps_re = re.compile(r"Setting TPS of world \w+ to (\d+)")
-    vr_re = re.compile(r"(?:Initial view radius is|View radius.*?to) (\d+)")
-
-    for line in reversed(output.splitlines()):
-        if tps is None:
-            match = tps_re.search(line)
-            if match:
-                tps = int(match.group(1))
-        if view_radius is None:
-            match = vr_re.search(line)
-            if match:
-                view_radius = int(match.group(1))
-        if tps is not None and view_radius is not None:
-            break
+    for match in _TPS_VR_RE.finditer(output):
+        if match.group("tps") is not None:
+            tps = match.group("tps")
+        else:
+            view_radius = match.group("vr")
 
-    return {"tps": tps, "view_radius": view_radius}
+    return {
+        "tps": int(tps) if tps is not None else None,
+        "view_radius": int(view_radius) if view_radius is not None else None,
+    }
 
 
 def get_players_from_logs_fallback() -> dict:
     """Fallback: Get players from logs if DB not available."""
-    output, rc = run_cmd(
-        ["journalctl", "-u", "hytale", "--no-pager", "-o", "short-iso", "--since", "3 days ago"],
-        timeout=30
-    )
-    if rc != 0:
-        return {"players": [], "error": output}
-    return {"players": parse_players(output), "ops": get_ops_list()}
+    players, error = get_player_entries()
+    if error:
+        return {"players": [], "error": error}
+    return {"players": players, "ops": get_ops_list()}
 
 
 def get_resource_usage() -> dict:
@@ -564,31 +839,32 @@ def get_resource_usage() -> dict:
     return result
 
 
+def _is_backup_archive(name: str) -> bool:
+    """Match the archive names listed by get_backups()."""
+    return (name.startswith("hytale_") and name.endswith(".tar.gz")) or name.endswith(".zip")
+
+
 def get_backups() -> dict:
     """List backup files sorted by mtime desc."""
     try:
         if not BACKUP_DIR.exists():
             return {"error": f"Backup-Verzeichnis nicht gefunden: {BACKUP_DIR}", "files": [], "count": 0, "last_backup": "n/a"}
 
-        backup_files = list(BACKUP_DIR.glob("hytale_*.tar.gz")) + list(BACKUP_DIR.glob("*.zip"))
-        files = sorted(
-            backup_files,
-            key=lambda f: f.stat().st_mtime,
-            reverse=True,
-        )
+        # One stat per entry: DirEntry caches it for the sort and the loop.
+        with os.scandir(BACKUP_DIR) as it:
+            entries = [(e, e.stat()) for e in it if _is_backup_archive(e.name)]
+        entries.sort(key=lambda item: item[1].st_mtime, reverse=True)
     except PermissionError:
         return {"error": "Keine Berechtigung auf Backup-Verzeichnis", "files": [], "count": 0, "last_backup": "n/a"}
 
     result = []
-    for f in files:
-        st = f.stat()
-        meta = read_backup_metadata(f)
+    for entry, st in entries:
+        meta = read_backup_metadata(Path(entry.path))
         result.append({
-            "name": f.name,
+            "name": entry.name,
             "size": human_size(st.st_size),
             "size_bytes": st.st_size,
-            "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
-                      .strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "mtime": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(st.st_mtime)),
             "label": meta.get("label", ""),
             "comment": meta.get("comment", ""),
             "source": meta.get("source", ""),
@@ -598,11 +874,25 @@ def get_backups() -> dict:
     return {"files": result, "count": len(result), "last_backup": last_backup}
 
 
-def parse_seed_from_world_config(raw: str) -> str | None:
+def get_backup_stats() -> tuple[int, int, float | None]:
+    """Return (count, total_bytes, newest_mtime) for backup archives."""
+    try:
+        with os.scandir(BACKUP_DIR) as it:
+            stats = [e.stat() for e in it if _is_backup_archive(e.name)]
+    except (PermissionError, OSError):
+        return 0, 0, None
+    if not stats:
+        return 0, 0, None
+    return len(stats), sum(st.st_size for st in stats), max(st.st_mtime for st in stats)
+
+
+def parse_seed_from_world_config(raw: str | bytes) -> str | None:
     """Return world seed from a world config JSON payload."""
     try:
         obj = json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
+    except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
+        return None
+    if not isinstance(obj, dict):
         return None
 
     seed = obj.get("Seed")
@@ -622,10 +912,22 @@ def backup_meta_path(backup_file: Path) -> Path:
     return backup_file.parent / f"{base}.meta"
 
 
+_BACKUP_META_CACHE_MAX = 512
+_backup_meta_cache: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
 def read_backup_metadata(backup_file: Path) -> dict[str, str]:
     meta_file = backup_meta_path(backup_file)
-    if not meta_file.exists():
+    try:
+        st = meta_file.stat()
+    except OSError:
         return {}
+    # Sidecars are written once by the backup script; reparse only on change
+    path_key = str(meta_file)
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _backup_meta_cache.get(path_key)
+    if cached and cached[0] == sig:
+        return dict(cached[1])
     data: dict[str, str] = {}
     try:
         for line in meta_file.read_text(encoding="utf-8", errors="ignore").splitlines():
@@ -637,29 +939,53 @@ def read_backup_metadata(backup_file: Path) -> dict[str, str]:
                 data[key] = value.strip()
     except (PermissionError, OSError):
         return {}
-    return data
+    if len(_backup_meta_cache) >= _BACKUP_META_CACHE_MAX:
+        _backup_meta_cache.clear()
+    _backup_meta_cache[path_key] = (sig, data)
+    return dict(data)
+
+
+_active_seed_cache: dict = {"key": None, "seed": None}
 
 
 def get_active_world_seed() -> str | None:
-    """Read active world seed from current world config."""
+    """Read active world seed from current world config.
+
+    The parsed seed is cached per (path, mtime) since this runs on every
+    status poll while the file rarely changes.
+    """
     candidates = [
         SERVER_DIR / "Server" / "universe" / "worlds" / "default" / "config.json",
         SERVER_DIR / "universe" / "worlds" / "default" / "config.json",
     ]
     for path in candidates:
         try:
-            if path.exists():
-                return parse_seed_from_world_config(path.read_text())
+            st = os.stat(path)
+        except OSError:
+            continue
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if _active_seed_cache["key"] == key:
+            return _active_seed_cache["seed"]
+        try:
+            seed = parse_seed_from_world_config(path.read_bytes())
         except (PermissionError, OSError):
             continue
+        _active_seed_cache["key"] = key
+        _active_seed_cache["seed"] = seed
+        return seed
     return None
 
 
 def _extract_seed_from_tar_archive(archive_path: Path) -> str | None:
     try:
         with tarfile.open(archive_path, "r:*") as tar:
+            # Iterate lazily: getmembers() would decompress the whole archive
+            # just to build the index, while the world config sits near the
+            # start and we can stop at the first hit.
             member = None
-            for m in tar.getmembers():
+            for m in tar:
+                if not m.isfile():
+                    continue
                 name = m.name.lstrip("./")
                 if name.endswith("universe/worlds/default/config.json"):
                     member = m
@@ -669,7 +995,7 @@ def _extract_seed_from_tar_archive(archive_path: Path) -> str | None:
             fh = tar.extractfile(member)
             if fh is None:
                 return None
-            return parse_seed_from_world_config(fh.read().decode("utf-8", errors="ignore"))
+            return parse_seed_from_world_config(fh.read())
     except (tarfile.TarError, OSError):
         return None
 
@@ -686,7 +1012,7 @@ def _extract_seed_from_zip_archive(archive_path: Path) -> str | None:
             if not target_name:
                 return None
             with zf.open(target_name) as fh:
-                return parse_seed_from_world_config(fh.read().decode("utf-8", errors="ignore"))
+                return parse_seed_from_world_config(fh.read())
     except (zipfile.BadZipFile, OSError):
         return None
 
@@ -699,16 +1025,23 @@ def _extract_seed_from_update_backup_dir(backup_dir: Path) -> str | None:
     for path in candidates:
         try:
             if path.exists():
-                return parse_seed_from_world_config(path.read_text())
+                return parse_seed_from_world_config(path.read_bytes())
         except (PermissionError, OSError):
             continue
     return None
 
 
-def get_backup_seed(path: Path, backup_type: str, force_refresh: bool = False) -> str | None:
+def get_backup_seed(
+    path: Path,
+    backup_type: str,
+    force_refresh: bool = False,
+    pending_rows: list[tuple] | None = None,
+) -> str | None:
     """
     Resolve and cache seed metadata for backup files/directories.
     Cache key uses size+mtime so updates invalidate automatically.
+    If pending_rows is given, new DB rows are appended there for a batched
+    write via set_backup_seeds_in_db() instead of being written one by one.
     """
     try:
         st = path.stat()
@@ -742,7 +1075,11 @@ def get_backup_seed(path: Path, backup_type: str, force_refresh: bool = False) -
 
     with _backup_seed_cache_lock:
         _backup_seed_cache[cache_key] = {"signature": signature, "seed": seed}
-    set_backup_seed_in_db(cache_key, backup_type, signature[0], signature[1], seed)
+    row = (cache_key, backup_type, signature[0], signature[1], seed)
+    if pending_rows is not None:
+        pending_rows.append(row)
+    else:
+        set_backup_seeds_in_db([row])
     return seed
 
 
@@ -759,83 +1096,101 @@ def ensure_backup_seed_cache_table() -> None:
     with _backup_seed_db_lock:
         if _backup_seed_db_ready or _backup_seed_db_disabled:
             return
-        conn = get_db_connection()
-        if not conn:
-            return
-        try:
-            c = conn.cursor()
-            c.execute("""
-                CREATE TABLE IF NOT EXISTS backup_seed_cache (
-                    path TEXT PRIMARY KEY,
-                    backup_type TEXT NOT NULL,
-                    mtime INTEGER NOT NULL,
-                    size_bytes INTEGER NOT NULL,
-                    seed TEXT,
-                    updated_at TEXT NOT NULL
-                )
-            """)
-            conn.commit()
-            _backup_seed_db_ready = True
-        except Exception:
-            _backup_seed_db_disabled = True
-        finally:
-            conn.close()
+        with db_writer() as conn:
+            if not conn:
+                return
+            try:
+                c = conn.cursor()
+                c.execute("""
+                    CREATE TABLE IF NOT EXISTS backup_seed_cache (
+                        path TEXT PRIMARY KEY,
+                        backup_type TEXT NOT NULL,
+                        mtime INTEGER NOT NULL,
+                        size_bytes INTEGER NOT NULL,
+                        seed TEXT,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
+                c.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_seed_type_mtime
+                    ON backup_seed_cache(backup_type, mtime DESC)
+                """)
+                conn.commit()
+                _backup_seed_db_ready = True
+            except Exception:
+                _backup_seed_db_disabled = True
 
 
 def get_backup_seed_from_db(path: str, backup_type: str, mtime: int, size_bytes: int) -> str | None:
     if _backup_seed_db_disabled:
         return None
-    conn = get_db_connection()
-    if not conn:
-        return None
-    try:
-        c = conn.cursor()
-        c.execute("""
-            SELECT seed, backup_type, mtime, size_bytes
-            FROM backup_seed_cache
-            WHERE path = ?
-            LIMIT 1
-        """, (path,))
-        row = c.fetchone()
-        if not row:
-            return None
-        if row["backup_type"] != backup_type:
+    with db_reader() as conn:
+        if not conn:
             return None
-        if int(row["mtime"]) != int(mtime) or int(row["size_bytes"]) != int(size_bytes):
+        try:
+            c = conn.cursor()
+            c.execute("""
+                SELECT seed, backup_type, mtime, size_bytes
+                FROM backup_seed_cache
+                WHERE path = ?
+                LIMIT 1
+            """, (path,))
+            row = c.fetchone()
+        except Exception:
             return None
-        return row["seed"]
-    except Exception:
+    if not row:
         return None
-    finally:
-        conn.close()
+    if row["backup_type"] != backup_type:
+        return None
+    if int(row["mtime"]) != int(mtime) or int(row["size_bytes"]) != int(size_bytes):
+        return None
+    return row["seed"]
 
 
-def set_backup_seed_in_db(path: str, backup_type: str, mtime: int, size_bytes: int, seed: str | None) -> None:
+def set_backup_seeds_in_db(rows: list[tuple]) -> None:
+    """Upsert (path, backup_type, mtime, size_bytes, seed) rows in one transaction."""
     global _backup_seed_db_disabled
-    if _backup_seed_db_disabled:
+    if not rows:
         return
-    conn = get_db_connection()
-    if not conn:
+    ensure_backup_seed_cache_table()
+    if _backup_seed_db_disabled:
         return
-    try:
-        c = conn.cursor()
-        c.execute("""
-            INSERT INTO backup_seed_cache(path, backup_type, mtime, size_bytes, seed, updated_at)
-            VALUES(?, ?, ?, ?, ?, ?)
-            ON CONFLICT(path) DO UPDATE SET
-                backup_type = excluded.backup_type,
-                mtime = excluded.mtime,
-                size_bytes = excluded.size_bytes,
-                seed = excluded.seed,
-                updated_at = excluded.updated_at
-        """, (path, backup_type, int(mtime), int(size_bytes), seed, datetime.now(timezone.utc).isoformat()))
-        conn.commit()
-    except Exception:
-        _backup_seed_db_disabled = True
-    finally:
-        conn.close()
+    now = datetime.now(timezone.utc).isoformat()
+    with db_writer() as conn:
+        if not conn:
+            return
+        try:
+            c = conn.cursor()
+            # Take the write lock up front rather than upgrading mid-transaction
+            c.execute("BEGIN IMMEDIATE")
+            c.executemany("""
+                INSERT INTO backup_seed_cache(path, backup_type, mtime, size_bytes, seed, updated_at)
+                VALUES(?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    backup_type = excluded.backup_type,
+                    mtime = excluded.mtime,
+                    size_bytes = excluded.size_bytes,
+                    seed = excluded.seed,
+                    updated_at = excluded.updated_at
+            """, [
+                (path, backup_type, int(mtime), int(size_bytes), seed, now)
+                for path, backup_type, mtime, size_bytes, seed in rows
+            ])
+            conn.commit()
+        except Exception:
+            _backup_seed_db_disabled = True
+            return
+        if len(rows) >= _SEED_ANALYZE_MIN_ROWS:
+            # Refresh planner stats after a bulk seed so the index is used.
+            # Optional: a failure here (e.g. the worker holds the write
+            # lock) must not disable the cache.
+            try:
+                conn.execute("ANALYZE backup_seed_cache")
+            except sqlite3.Error:
+                pass
 
 
+@_ttl_cache(10)
 def get_disk_usage() -> dict:
     """Disk usage for /opt/hytale-server."""
     try:
@@ -852,6 +1207,7 @@ def get_disk_usage() -> dict:
         return {"error": str(e)}
 
 
+@_ttl_cache(10)
 def get_version_info() -> dict:
     """Read current and latest version from state files."""
     current = "unknown"
@@ -881,49 +1237,62 @@ def get_version_info() -> dict:
     }
 
 
+_backup_count_cache: dict = {"mtime": None, "count": 0}
+
+
 def get_backup_count() -> int:
-    """Return the current number of backup files."""
+    """Return the current number of backup files.
+
+    Adding or removing a file bumps the directory mtime, so the count is
+    only rescanned when that changes.
+    """
     try:
-        if not BACKUP_DIR.exists():
-            return 0
-        files = list(BACKUP_DIR.glob("hytale_*.tar.gz")) + list(BACKUP_DIR.glob("*.zip"))
-        return len(files)
+        mtime = os.stat(BACKUP_DIR).st_mtime_ns
+        if mtime == _backup_count_cache["mtime"]:
+            return _backup_count_cache["count"]
+        with os.scandir(BACKUP_DIR) as it:
+            count = sum(1 for e in it if _is_backup_archive(e.name))
     except (PermissionError, OSError):
         return 0
+    _backup_count_cache["mtime"] = mtime
+    _backup_count_cache["count"] = count
+    return count
 
 
-def check_auto_update() -> None:
-    """If update-after-backup flag is set and a new backup appeared, trigger update."""
-    if not UPDATE_AFTER_BACKUP_FLAG.exists():
-        return
+def check_auto_update(current_count: int | None = None) -> None:
+    """If update-after-backup flag is set and a new backup appeared, trigger update.
+
+    Callers that already scanned the backup directory can pass the count.
+    """
     if not ALLOW_CONTROL:
         return
     try:
+        # A missing flag file lands in OSError; no separate exists() check
         stored_count = int(UPDATE_AFTER_BACKUP_FLAG.read_text().strip())
     except (ValueError, OSError):
         return
-    current_count = get_backup_count()
+    if current_count is None:
+        current_count = get_backup_count()
     if current_count > stored_count:
         # New backup detected, trigger update
         run_cmd(with_optional_sudo([UPDATE_SCRIPT, "update"]), timeout=300)
+        get_version_info.cache_clear()
         # Flag is removed by the update script
 
 
 def read_timestamp(path: Path) -> datetime | None:
     try:
-        if not path.exists():
-            return None
         value = path.read_text().strip()
-        if not value:
-            return None
-        try:
-            return datetime.fromtimestamp(float(value), tz=timezone.utc)
-        except ValueError:
-            try:
-                return datetime.fromisoformat(value)
-            except ValueError:
-                return None
-    except (ValueError, OSError):
+    except OSError:
+        return None
+    if not value:
+        return None
+    try:
+        # ISO dates have a dash at index 4; everything else is an epoch value
+        if len(value) >= 5 and value[4] == "-":
+            return datetime.fromisoformat(value)
+        return datetime.fromtimestamp(float(value), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
         return None
 
 
@@ -935,41 +1304,103 @@ def write_timestamp(path: Path, value: datetime) -> None:
 
 
 def parse_players(output: str) -> list[dict]:
-    players = {}
-    join_re = re.compile(
-        r"(\S+T\S+).*Adding player '([^']+)' to world '([^']+)' at location .+\(([a-f0-9-]+)\)"
-    )
-    leave_re = re.compile(
-        r"(\S+T\S+).*Removing player '([^']+?)(?:\s*\([^)]+\))?'.*\(([a-f0-9-]+)\)\s*$"
-    )
-    for line in output.splitlines():
-        m = join_re.search(line)
-        if m:
-            ts, name, world, uuid = m.group(1), m.group(2), m.group(3), m.group(4)
+    return list(_apply_player_events(output, {}).values())
+
+
+def _apply_player_events(output: str, players: dict[str, dict]) -> dict[str, dict]:
+    """Fold join/leave log lines into a uuid -> player state mapping."""
+    for m in _PLAYER_EVENT_RE.finditer(output):
+        uuid = m.group("juuid")
+        if uuid is not None:
             players[uuid] = {
-                "name": name, "uuid": uuid,
-                "online": True, "last_login": ts,
-                "last_logout": None, "world": world, "position": None,
+                "name": m.group("jname"), "uuid": uuid,
+                "online": True, "last_login": m.group("ts"),
+                "last_logout": None, "world": m.group("world"), "position": None,
             }
             continue
-        m = leave_re.search(line)
-        if m:
-            ts, name, uuid = m.group(1), m.group(2), m.group(3)
-            if uuid in players:
-                players[uuid]["online"] = False
-                players[uuid]["last_logout"] = ts
-    return list(players.values())
+        uuid = m.group("luuid")
+        if uuid in players:
+            players[uuid]["online"] = False
+            players[uuid]["last_logout"] = m.group("ts")
+    return players
+
+
+# Incremental journal reader state for get_player_entries()
+_player_log_lock = Lock()
+_player_log_state: dict = {"cursor": None, "players": {}}
+# History window: the first read covers it, later reads age players out of it
+PLAYER_LOG_DAYS = 3
+_JOURNAL_CURSOR_PREFIX = "-- cursor: "
+
+
+_PLAYER_EVENT_GREP = "Adding player|Removing player"
+_journal_grep_supported = True
+
+
+def run_journal_grep(cmd: list[str], pattern: str, timeout: int = 30) -> tuple[str, int]:
+    """Run journalctl with --grep so only matching entries cross the pipe.
+
+    Falls back to the unfiltered command (for the rest of the process
+    lifetime) when journalctl was built without pattern matching support.
+    """
+    global _journal_grep_supported
+    if _journal_grep_supported:
+        output, rc = run_cmd([*cmd, "--grep", pattern], timeout=timeout)
+        if rc == 0:
+            return output, rc
+        if not output.strip():
+            # -q plus no matching entries: journalctl exits non-zero silently
+            return "", 0
+        if "pattern" not in output.lower():
+            return output, rc
+        _journal_grep_supported = False
+    return run_cmd(cmd, timeout=timeout)
+
+
+def _prune_player_entries(players: dict[str, dict], cutoff: datetime) -> None:
+    """Drop players whose latest join/leave is older than cutoff."""
+    for uuid, player in list(players.items()):
+        latest = max(player["last_login"], player["last_logout"] or "")
+        try:
+            seen = datetime.fromisoformat(latest)
+        except ValueError:
+            continue
+        if seen.tzinfo is None:
+            seen = seen.replace(tzinfo=timezone.utc)
+        if seen < cutoff:
+            del players[uuid]
 
 
 def get_player_entries() -> tuple[list[dict], str | None]:
-    # Use time-based filter (last 3 days) for player history - balance of coverage vs speed
-    output, rc = run_cmd(
-        ["journalctl", "-u", "hytale", "--no-pager", "-o", "short-iso", "--since", "3 days ago"],
-        timeout=30
-    )
-    if rc != 0:
-        return [], output
-    return parse_players(output), None
+    """Return known players, reading only journal entries since the last call.
+
+    The first call loads the last PLAYER_LOG_DAYS days; later calls resume
+    after the saved journal cursor, fold the new lines into the cached player
+    state and drop players last seen before that window.
+    """
+    with _player_log_lock:
+        cursor = _player_log_state["cursor"]
+        cmd = ["journalctl", "-u", "hytale", "--no-pager", "-q", "-o", "short-iso", "--show-cursor"]
+        if cursor:
+            cmd.append(f"--after-cursor={cursor}")
+        else:
+            # Use time-based filter (last 3 days) for player history - balance of coverage vs speed
+            cmd.extend(["--since", f"{PLAYER_LOG_DAYS} days ago"])
+        # The Python regex stays as the parser over the filtered output
+        output, rc = run_journal_grep(cmd, _PLAYER_EVENT_GREP, timeout=30)
+        if rc != 0:
+            return [], output
+
+        # The cursor line closes journalctl's stdout; anything after it is stderr
+        idx = output.rfind(_JOURNAL_CURSOR_PREFIX)
+        if idx != -1 and (idx == 0 or output[idx - 1] == "\n"):
+            cursor_line = output[idx + len(_JOURNAL_CURSOR_PREFIX):].split("\n", 1)[0]
+            _player_log_state["cursor"] = cursor_line.strip()
+            output = output[:idx]
+
+        players = _apply_player_events(output, _player_log_state["players"])
+        _prune_player_entries(players, datetime.now(timezone.utc) - timedelta(days=PLAYER_LOG_DAYS))
+        return [dict(p) for p in players.values()], None
 
 
 def get_online_players() -> list[str] | None:
@@ -979,6 +1410,9 @@ def get_online_players() -> list[str] | None:
     return [p["name"] for p in players if p.get("online")]
 
 
+_HAS_WRITEV = hasattr(os, "writev")
+
+
 def send_console_command(command: str, ignore_errors: bool = False) -> None:
     """
     Send a command to the Hytale server console via FIFO pipe.
@@ -1005,11 +1439,21 @@ def send_console_command(command: str, ignore_errors: bool = False) -> None:
         return
     
     try:
+        # Using strict encoding to reject invalid UTF-8 rather than silently dropping characters.
+        # Encode before opening so a bad command cannot leak the pipe fd.
+        cmd_bytes = command.encode('utf-8', errors='strict')
+        # Open per command: the wrapper's `tail -f` only passes data on once
+        # the writer closes, so the fd must not be kept open.
+        # O_NONBLOCK: fails with ENXIO instead of hanging without a reader.
         fd = os.open(str(CONSOLE_PIPE), os.O_WRONLY | os.O_NONBLOCK)
-        # Only write the command itself, newline is added here
-        # Using strict encoding to reject invalid UTF-8 rather than silently dropping characters
-        os.write(fd, (command + "\n").encode('utf-8', errors='strict'))
-        os.close(fd)
+        try:
+            # Only write the command itself, newline is added here
+            if _HAS_WRITEV:
+                os.writev(fd, [cmd_bytes, b"\n"])
+            else:
+                os.write(fd, cmd_bytes + b"\n")
+        finally:
+            os.close(fd)
     except UnicodeEncodeError as exc:
         if ignore_errors:
             return
@@ -1055,6 +1499,7 @@ def should_run_version_check(now: datetime) -> bool:
 
 def check_for_updates() -> dict | None:
     output, rc = run_cmd(with_optional_sudo([UPDATE_SCRIPT, "check"]), timeout=300)
+    get_version_info.cache_clear()
     if rc != 0:
         return None
     try:
@@ -1076,8 +1521,9 @@ def apply_postpone_if_requested() -> bool:
     else:
         last_cursor = read_timestamp(UPDATE_COMMAND_CURSOR_FILE) or datetime.min.replace(tzinfo=timezone.utc)
     since_arg = f"@{int(last_cursor.timestamp())}"
-    output, rc = run_cmd(
-        ["journalctl", "-u", "hytale", "--no-pager", "-o", "short-iso", f"--since={since_arg}"],
+    output, rc = run_journal_grep(
+        ["journalctl", "-u", "hytale", "--no-pager", "-q", "-o", "short-iso", f"--since={since_arg}"],
+        f"<[^>]+> {re.escape(UPDATE_POSTPONE_COMMAND)}",
         timeout=10
     )
     if rc != 0:
@@ -1097,6 +1543,7 @@ def schedule_or_run_update() -> None:
         schedule = load_update_schedule()
         if schedule and now >= schedule:
             run_cmd(with_optional_sudo([UPDATE_SCRIPT, "update"]), timeout=600)
+            get_version_info.cache_clear()
             clear_update_schedule()
         return
     if not has_update_available():
@@ -1106,6 +1553,7 @@ def schedule_or_run_update() -> None:
         return
     if not online_players:
         run_cmd(with_optional_sudo([UPDATE_SCRIPT, "update"]), timeout=600)
+        get_version_info.cache_clear()
         return
     scheduled_at = now + timedelta(minutes=UPDATE_NOTICE_MINUTES)
     if load_update_schedule():
@@ -1151,16 +1599,19 @@ def should_allow_console_command(command: str) -> tuple[bool, str]:
     
     command_stripped = command.strip()
     
-    # Check for shell metacharacters that could enable command injection
-    if any(char in SHELL_METACHARACTERS for char in command):
-        return False, "Command contains forbidden characters (shell metacharacters)"
+    # Check for shell metacharacters that could enable command injection,
+    # null bytes and other control characters in one pass
+    match = _FORBIDDEN_CHAR_RE.search(command)
+    if match:
+        char = match.group()
+        if char in SHELL_METACHARACTERS:
+            return False, "Command contains forbidden characters (shell metacharacters)"
+        if char == "\x00":
+            return False, "Command contains null bytes"
+        return False, "Command contains forbidden characters (control characters)"
     
-    # Check for null bytes
-    if '\x00' in command:
-        return False, "Command contains null bytes"
-    
-    # Get first word (command name)
-    parts = command_stripped.split()
+    # Get first word (command name); maxsplit keeps the rest unsplit
+    parts = command_stripped.split(None, 1)
     if not parts:
         return False, "Invalid command format"
     
@@ -1172,25 +1623,42 @@ def should_allow_console_command(command: str) -> tuple[bool, str]:
     
     # Check for dangerous patterns in entire command
     command_lower = command_stripped.lower()
-    for pattern in DANGEROUS_PATTERNS:
-        if pattern.search(command_lower):
+    if "/" in command_lower:
+        match = _DANGEROUS_PATH_RE.search(command_lower)
+        if match:
+            pattern = _DANGEROUS_PATH_PATTERNS[match.lastindex - 1]
             return False, f"Command contains forbidden pattern: {pattern.pattern}"
+    match = _DANGEROUS_WORD_RE.search(command_lower)
+    if match:
+        pattern = _DANGEROUS_WORDS[match.group(1)]
+        return False, f"Command contains forbidden pattern: {pattern.pattern}"
     
     # Command passes all security checks
     return True, ""
 
 
+_ops_cache = {"key": None, "ops": []}
+
+
 def get_ops_list() -> list[str]:
     ops_file = SERVER_DIR / "ops.json"
-    if not ops_file.exists():
+    try:
+        st = ops_file.stat()
+    except OSError:
         return []
+    # ops.json only changes on /op add|remove; reparse when the file does
+    key = (st.st_mtime_ns, st.st_size)
+    if _ops_cache["key"] == key:
+        return list(_ops_cache["ops"])
     try:
-        data = json.loads(ops_file.read_text())
-        if isinstance(data, list):
-            return [str(entry) for entry in data]
-    except (json.JSONDecodeError, OSError):
+        # json.loads takes bytes directly, skipping a separate decode step
+        data = json.loads(ops_file.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return []
-    return []
+    ops = [str(entry) for entry in data] if isinstance(data, list) else []
+    _ops_cache["key"] = key
+    _ops_cache["ops"] = ops
+    return list(ops)
 
 
 def set_operator(name: str, enable: bool) -> None:
@@ -1203,9 +1671,10 @@ def set_operator(name: str, enable: bool) -> None:
 
 def parse_chat_commands(output: str) -> list[dict]:
     entries = []
-    chat_re = re.compile(r"(\S+T\S+).*<([^>]+)> (.+)")
     for line in output.splitlines():
-        match = chat_re.search(line)
+        if "> " not in line:
+            continue
+        match = _CHAT_RE.search(line)
         if not match:
             continue
         ts, player, message = match.group(1), match.group(2), match.group(3).strip()
@@ -1214,6 +1683,9 @@ def parse_chat_commands(output: str) -> list[dict]:
 
 
 def apply_postpone_chat_commands(output: str) -> bool:
+    # Most polled windows contain no postpone request; skip the chat parse
+    if UPDATE_POSTPONE_COMMAND not in output:
+        return False
     scheduled = load_update_schedule()
     if not scheduled:
         return False
@@ -1271,11 +1743,14 @@ async def setup(request: Request, user: str = Depends(verify_credentials)):
 
 def _get_status_data() -> dict:
     """Sync function to gather all status data."""
-    check_auto_update()
+    # One backup directory scan serves both the listing and the
+    # update-after-backup check.
+    backups = get_backups()
+    check_auto_update(backups["count"] if "error" not in backups else None)
     check_hourly_updates()
     return {
         "service": get_service_status(),
-        "backups": get_backups(),
+        "backups": backups,
         "world": get_world_info(),
         "disk": get_disk_usage(),
         "version": get_version_info(),
@@ -1285,13 +1760,13 @@ def _get_status_data() -> dict:
 
 @app.get("/api/status")
 async def api_status(user: str = Depends(verify_credentials)):
-    loop = asyncio.get_event_loop()
-    data = await loop.run_in_executor(_executor, _get_status_data)
+    data = await run_blocking(_get_status_data)
     return JSONResponse(data)
 
 
 # Cache for performance data (updated every 5 seconds max)
 _perf_cache: dict = {"data": None, "ts": 0}
+_perf_cache_lock = asyncio.Lock()
 
 
 def _get_perf_data() -> dict:
@@ -1303,71 +1778,75 @@ def _get_perf_data() -> dict:
 async def api_performance(user: str = Depends(verify_credentials)):
     """Lightweight endpoint for performance data from SQLite."""
     # SQLite reads are fast, minimal caching needed
-    now = time.time()
-    if _perf_cache["data"] is None or now - _perf_cache["ts"] > 2:
-        loop = asyncio.get_event_loop()
-        _perf_cache["data"] = await loop.run_in_executor(_executor, _get_perf_data)
-        _perf_cache["ts"] = now
+    if _perf_cache["data"] is None or time.time() - _perf_cache["ts"] > 2:
+        # One refresh in flight; callers arriving meanwhile reuse its result
+        async with _perf_cache_lock:
+            if _perf_cache["data"] is None or time.time() - _perf_cache["ts"] > 2:
+                _perf_cache["data"] = await run_blocking(_get_perf_data)
+                _perf_cache["ts"] = time.time()
     return JSONResponse(_perf_cache["data"])
 
 
 @app.get("/api/performance/history")
 async def api_performance_history(user: str = Depends(verify_credentials), hours: int = 1):
     """Get performance history for graphs."""
-    loop = asyncio.get_event_loop()
-    data = await loop.run_in_executor(_executor, get_performance_history, hours)
+    data = await run_blocking(get_performance_history, hours)
     return JSONResponse({"history": data})
 
 
-def get_metrics_data() -> str:
-    """Generate Prometheus-compatible metrics."""
-    lines = []
-
+# Static HELP/TYPE block of the Prometheus exposition, built once
+_METRICS_PREAMBLE = (
     # Performance metrics
-    lines.append("# HELP hytale_tps Current server TPS (ticks per second)")
-    lines.append("# TYPE hytale_tps gauge")
-    lines.append("# HELP hytale_cpu_percent Server CPU usage percentage")
-    lines.append("# TYPE hytale_cpu_percent gauge")
-    lines.append("# HELP hytale_ram_mb Server RAM usage in MB")
-    lines.append("# TYPE hytale_ram_mb gauge")
-    lines.append("# HELP hytale_ram_percent Server RAM usage percentage")
-    lines.append("# TYPE hytale_ram_percent gauge")
-    lines.append("# HELP hytale_view_radius Current view radius")
-    lines.append("# TYPE hytale_view_radius gauge")
+    "# HELP hytale_tps Current server TPS (ticks per second)\n"
+    "# TYPE hytale_tps gauge\n"
+    "# HELP hytale_cpu_percent Server CPU usage percentage\n"
+    "# TYPE hytale_cpu_percent gauge\n"
+    "# HELP hytale_ram_mb Server RAM usage in MB\n"
+    "# TYPE hytale_ram_mb gauge\n"
+    "# HELP hytale_ram_percent Server RAM usage percentage\n"
+    "# TYPE hytale_ram_percent gauge\n"
+    "# HELP hytale_view_radius Current view radius\n"
+    "# TYPE hytale_view_radius gauge\n"
 
     # Player metrics
-    lines.append("# HELP hytale_players_online Number of online players")
-    lines.append("# TYPE hytale_players_online gauge")
-    lines.append("# HELP hytale_players_total Total known players")
-    lines.append("# TYPE hytale_players_total gauge")
+    "# HELP hytale_players_online Number of online players\n"
+    "# TYPE hytale_players_online gauge\n"
+    "# HELP hytale_players_total Total known players\n"
+    "# TYPE hytale_players_total gauge\n"
 
     # Server status
-    lines.append("# HELP hytale_server_up Server running status (1=up, 0=down)")
-    lines.append("# TYPE hytale_server_up gauge")
+    "# HELP hytale_server_up Server running status (1=up, 0=down)\n"
+    "# TYPE hytale_server_up gauge\n"
 
     # Disk metrics
-    lines.append("# HELP hytale_disk_total_bytes Total disk space in bytes")
-    lines.append("# TYPE hytale_disk_total_bytes gauge")
-    lines.append("# HELP hytale_disk_used_bytes Used disk space in bytes")
-    lines.append("# TYPE hytale_disk_used_bytes gauge")
-    lines.append("# HELP hytale_disk_free_bytes Free disk space in bytes")
-    lines.append("# TYPE hytale_disk_free_bytes gauge")
-    lines.append("# HELP hytale_disk_used_percent Disk usage percentage")
-    lines.append("# TYPE hytale_disk_used_percent gauge")
+    "# HELP hytale_disk_total_bytes Total disk space in bytes\n"
+    "# TYPE hytale_disk_total_bytes gauge\n"
+    "# HELP hytale_disk_used_bytes Used disk space in bytes\n"
+    "# TYPE hytale_disk_used_bytes gauge\n"
+    "# HELP hytale_disk_free_bytes Free disk space in bytes\n"
+    "# TYPE hytale_disk_free_bytes gauge\n"
+    "# HELP hytale_disk_used_percent Disk usage percentage\n"
+    "# TYPE hytale_disk_used_percent gauge\n"
 
     # Backup metrics
-    lines.append("# HELP hytale_backups_count Total number of backups")
-    lines.append("# TYPE hytale_backups_count gauge")
-    lines.append("# HELP hytale_backups_size_bytes Total size of all backups in bytes")
-    lines.append("# TYPE hytale_backups_size_bytes gauge")
-    lines.append("# HELP hytale_backup_last_timestamp Unix timestamp of last backup")
-    lines.append("# TYPE hytale_backup_last_timestamp gauge")
+    "# HELP hytale_backups_count Total number of backups\n"
+    "# TYPE hytale_backups_count gauge\n"
+    "# HELP hytale_backups_size_bytes Total size of all backups in bytes\n"
+    "# TYPE hytale_backups_size_bytes gauge\n"
+    "# HELP hytale_backup_last_timestamp Unix timestamp of last backup\n"
+    "# TYPE hytale_backup_last_timestamp gauge\n"
 
     # Mod metrics
-    lines.append("# HELP hytale_mods_count Number of installed mods")
-    lines.append("# TYPE hytale_mods_count gauge")
-    lines.append("# HELP hytale_mods_enabled Number of enabled mods")
-    lines.append("# TYPE hytale_mods_enabled gauge")
+    "# HELP hytale_mods_count Number of installed mods\n"
+    "# TYPE hytale_mods_count gauge\n"
+    "# HELP hytale_mods_enabled Number of enabled mods\n"
+    "# TYPE hytale_mods_enabled gauge\n"
+)
+
+
+def get_metrics_data() -> str:
+    """Generate Prometheus-compatible metrics."""
+    lines = []
 
     # Get performance data
     perf = get_performance_from_db()
@@ -1383,11 +1862,9 @@ def get_metrics_data() -> str:
         lines.append(f'hytale_view_radius {perf["view_radius"]}')
 
     # Get player data
-    players_data = get_players_from_db()
-    players = players_data.get("players", [])
-    online_count = sum(1 for p in players if p.get("online"))
+    online_count, total_count = get_player_counts()
     lines.append(f'hytale_players_online {online_count}')
-    lines.append(f'hytale_players_total {len(players)}')
+    lines.append(f'hytale_players_total {total_count}')
 
     # Server status
     status = get_service_status()
@@ -1405,74 +1882,111 @@ def get_metrics_data() -> str:
         pass
 
     # Backup stats
-    try:
-        backups = get_backups()
-        lines.append(f'hytale_backups_count {backups.get("count", 0)}')
-        total_size = sum(f.get("size_bytes", 0) for f in backups.get("files", []))
-        lines.append(f'hytale_backups_size_bytes {total_size}')
-        # Parse last backup timestamp
-        last_backup = backups.get("last_backup", "")
-        if last_backup and last_backup != "n/a":
-            try:
-                from datetime import datetime
-                dt = datetime.strptime(last_backup, "%Y-%m-%d %H:%M:%S UTC")
-                lines.append(f'hytale_backup_last_timestamp {int(dt.timestamp())}')
-            except Exception:
-                pass
-    except Exception:
-        pass
+    backup_count, backup_bytes, last_backup_mtime = get_backup_stats()
+    lines.append(f'hytale_backups_count {backup_count}')
+    lines.append(f'hytale_backups_size_bytes {backup_bytes}')
+    if last_backup_mtime is not None:
+        lines.append(f'hytale_backup_last_timestamp {int(last_backup_mtime)}')
 
     # Mod stats
     try:
-        if MODS_DIR.exists():
-            mods = [d for d in MODS_DIR.iterdir() if d.is_dir()]
-            enabled = sum(1 for d in mods if not d.name.endswith(".disabled"))
-            lines.append(f'hytale_mods_count {len(mods)}')
-            lines.append(f'hytale_mods_enabled {enabled}')
+        # scandir reports the entry type from the dirent, no stat per mod
+        with os.scandir(MODS_DIR) as it:
+            mods = [e.name for e in it if e.is_dir()]
+        enabled = sum(1 for name in mods if not name.endswith(".disabled"))
+        lines.append(f'hytale_mods_count {len(mods)}')
+        lines.append(f'hytale_mods_enabled {enabled}')
     except Exception:
         pass
 
-    return "\n".join(lines) + "\n"
+    return _METRICS_PREAMBLE + "\n".join(lines) + "\n"
+
+
+METRICS_CACHE_TTL = 5
+_metrics_cache = {"plain": None, "gz": None, "ts": None}
+
+
+def _render_metrics() -> tuple[bytes, bytes]:
+    """Rendered metrics body, plain and gzip, shared by scrapes within the TTL."""
+    now = time.monotonic()
+    if _metrics_cache["ts"] is not None and now - _metrics_cache["ts"] < METRICS_CACHE_TTL:
+        return _metrics_cache["plain"], _metrics_cache["gz"]
+    plain = get_metrics_data().encode("utf-8")
+    gz = gzip.compress(plain, compresslevel=1)
+    _metrics_cache.update(plain=plain, gz=gz, ts=now)
+    return plain, gz
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip; q=0 means refused."""
+    wildcard = None
+    for token in accept_encoding.split(","):
+        coding, _, params = token.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    # "*" covers gzip only when gzip itself isn't listed
+    return bool(wildcard)
+
+
+async def _metrics_response(request: Request) -> Response:
+    plain, gz = await run_blocking(_render_metrics)
+    headers = {"Vary": "Accept-Encoding"}
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(gz, media_type="text/plain; charset=utf-8", headers=headers)
+    return Response(plain, media_type="text/plain; charset=utf-8", headers=headers)
 
 
 @app.get("/metrics")
-async def prometheus_metrics():
+async def prometheus_metrics(request: Request):
     """Prometheus-compatible metrics endpoint (no auth for scraping)."""
-    from fastapi.responses import PlainTextResponse
-    loop = asyncio.get_event_loop()
-    data = await loop.run_in_executor(_executor, get_metrics_data)
-    return PlainTextResponse(data, media_type="text/plain; charset=utf-8")
+    return await _metrics_response(request)
 
 
 @app.get("/api/metrics")
-async def api_metrics(user: str = Depends(verify_credentials)):
+async def api_metrics(request: Request, user: str = Depends(verify_credentials)):
     """Prometheus metrics with authentication."""
-    from fastapi.responses import PlainTextResponse
-    loop = asyncio.get_event_loop()
-    data = await loop.run_in_executor(_executor, get_metrics_data)
-    return PlainTextResponse(data, media_type="text/plain; charset=utf-8")
+    return await _metrics_response(request)
 
 
 @app.get("/api/logs")
 async def api_logs(user: str = Depends(verify_credentials)):
-    loop = asyncio.get_event_loop()
-    lines = await loop.run_in_executor(_executor, get_logs)
+    lines = await run_blocking(get_logs)
     return JSONResponse({"lines": lines})
 
 
+AUTH_LOG_RING_SIZE = 40
+_AUTH_LINE_RE = re.compile(r"auth|token|session", re.IGNORECASE)
+
+
 @app.get("/api/auth/status")
 async def api_auth_status(user: str = Depends(verify_credentials)):
-    loop = asyncio.get_event_loop()
-    lines = await loop.run_in_executor(_executor, get_logs)
-    auth_lines = [ln for ln in lines if re.search(r"auth|token|session", ln, re.IGNORECASE)][-40:]
-    lower_lines = [ln.lower() for ln in auth_lines]
+    lines = await run_blocking(get_logs)
+    # Bounded ring: only the newest matches are kept, lowercased once
+    ring: deque[tuple[str, str]] = deque(maxlen=AUTH_LOG_RING_SIZE)
+    search = _AUTH_LINE_RE.search
+    for ln in lines:
+        if search(ln):
+            ring.append((ln, ln.lower()))
+    auth_lines = [ln for ln, _ in ring]
 
     def last_index(patterns: list[str]) -> int:
-        idx = -1
-        for i, ln in enumerate(lower_lines):
-            if any(p in ln for p in patterns):
-                idx = i
-        return idx
+        for i in range(len(ring) - 1, -1, -1):
+            lower = ring[i][1]
+            if any(p in lower for p in patterns):
+                return i
+        return -1
 
     success_idx = last_index([
         "starting authenticated flow",
@@ -1512,16 +2026,18 @@ async def api_token_backups(user: str = Depends(verify_credentials)):
     token_dir = BACKUP_DIR / "auth_tokens"
     result = []
     try:
-        if token_dir.exists():
-            for f in sorted(token_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-                if not f.is_file() or f.suffix != ".enc":
-                    continue
-                st = f.stat()
-                result.append({
-                    "name": f.name,
-                    "size": human_size(st.st_size),
-                    "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
-                })
+        # DirEntry caches its stat result, so sorting and display share one
+        # syscall per file. A missing directory lands in OSError.
+        with os.scandir(token_dir) as it:
+            entries = [e for e in it if e.name.endswith(".enc") and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for e in entries:
+            st = e.stat()
+            result.append({
+                "name": e.name,
+                "size": human_size(st.st_size),
+                "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
+            })
     except (PermissionError, OSError):
         pass
     return JSONResponse({"backups": result})
@@ -1531,7 +2047,7 @@ async def api_token_backups(user: str = Depends(verify_credentials)):
 async def api_token_backup(user: str = Depends(verify_credentials)):
     if not ALLOW_CONTROL:
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert.")
-    output, rc = await asyncio.to_thread(run_cmd, with_optional_sudo([TOKEN_SCRIPT, "backup"]), 120)
+    output, rc = await run_cmd_async(with_optional_sudo([TOKEN_SCRIPT, "backup"]), timeout=120)
     if rc != 0:
         raise HTTPException(status_code=500, detail=output or "Token-Backup fehlgeschlagen.")
     return {"ok": True, "message": "Token-Backup erstellt.", "output": output}
@@ -1547,7 +2063,7 @@ async def api_token_restore(request: Request, user: str = Depends(verify_credent
     name = str(body.get("name", "")).strip()
     if not name or Path(name).name != name or not name.endswith(".enc"):
         raise HTTPException(status_code=400, detail="Ungueltiger Token-Backup Name.")
-    output, rc = await asyncio.to_thread(run_cmd, with_optional_sudo([TOKEN_SCRIPT, "restore", name]), 180)
+    output, rc = await run_cmd_async(with_optional_sudo([TOKEN_SCRIPT, "restore", name]), timeout=180)
     if rc != 0:
         raise HTTPException(status_code=500, detail=output or "Token-Restore fehlgeschlagen.")
     return {"ok": True, "message": "Token wiederhergestellt und Server neu gestartet.", "output": output}
@@ -1570,7 +2086,7 @@ async def api_server_action(action: str, user: str = Depends(verify_credentials)
         }
         if action not in docker_actions:
             raise HTTPException(status_code=400, detail=f"Unbekannte Aktion: {action}")
-        output, rc = run_cmd(docker_actions[action], timeout=60)
+        output, rc = await run_cmd_async(docker_actions[action], timeout=60)
     else:
         # Native mode with systemctl
         allowed = {
@@ -1580,7 +2096,7 @@ async def api_server_action(action: str, user: str = Depends(verify_credentials)
         }
         if action not in allowed:
             raise HTTPException(status_code=400, detail=f"Unbekannte Aktion: {action}")
-        output, rc = run_cmd(allowed[action], timeout=30)
+        output, rc = await run_cmd_async(allowed[action], timeout=30)
 
     if rc != 0:
         raise HTTPException(status_code=500, detail=output)
@@ -1593,9 +2109,9 @@ async def api_backup_run(user: str = Depends(verify_credentials)):
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert. ALLOW_CONTROL=true setzen.")
 
     if DOCKER_MODE:
-        output, rc = run_cmd(with_optional_sudo([MANUAL_BACKUP_SCRIPT, "", ""]), timeout=240)
+        output, rc = await run_cmd_async(with_optional_sudo([MANUAL_BACKUP_SCRIPT, "", ""]), timeout=240)
     else:
-        output, rc = run_cmd(with_optional_sudo(["/usr/local/sbin/hytale-backup.sh"]), timeout=120)
+        output, rc = await run_cmd_async(with_optional_sudo(["/usr/local/sbin/hytale-backup.sh"]), timeout=120)
     if rc != 0:
         raise HTTPException(status_code=500, detail=output)
     return {"ok": True, "output": output}
@@ -1620,7 +2136,7 @@ async def api_backup_create(request: Request, user: str = Depends(verify_credent
     if len(comment) > 240:
         raise HTTPException(status_code=400, detail="Kommentar zu lang (max. 240 Zeichen).")
 
-    output, rc = run_cmd(with_optional_sudo([MANUAL_BACKUP_SCRIPT, label, comment]), timeout=240)
+    output, rc = await run_cmd_async(with_optional_sudo([MANUAL_BACKUP_SCRIPT, label, comment]), timeout=240)
     if rc != 0:
         raise HTTPException(status_code=500, detail=output)
     return {"ok": True, "output": output}
@@ -1635,25 +2151,34 @@ HYTALE_OVERRIDE_FILE = HYTALE_OVERRIDE_DIR / "override.conf"
 ALLOWED_FREQUENCIES = [0, 30, 60, 120, 360]  # 0 = deaktiviert
 
 
+_BACKUP_FREQUENCY_RE = re.compile(rb'HYTALE_BACKUP_FREQUENCY[="](\d+)')
+_backup_frequency_cache = {"key": None, "value": 30}
+
+
 def get_backup_frequency() -> int:
     """Read current backup frequency from override.conf Environment variable."""
     # Check override first for HYTALE_BACKUP_FREQUENCY environment variable
     try:
-        if HYTALE_OVERRIDE_FILE.exists():
-            content = HYTALE_OVERRIDE_FILE.read_text()
-            for line in content.splitlines():
-                stripped = line.strip()
-                if "HYTALE_BACKUP_FREQUENCY" in stripped:
-                    # Parse Environment="HYTALE_BACKUP_FREQUENCY=30"
-                    import re
-                    match = re.search(r'HYTALE_BACKUP_FREQUENCY[="](\d+)', stripped)
-                    if match:
-                        return int(match.group(1))
-    except (PermissionError, ValueError):
-        pass
-
-    # Default value (30 minutes) if no override exists
-    return 30
+        st = HYTALE_OVERRIDE_FILE.stat()
+    except OSError:
+        # Default value (30 minutes) if no override exists
+        return 30
+    # Only re-read override.conf when it changed on disk
+    key = (st.st_mtime_ns, st.st_size)
+    if _backup_frequency_cache["key"] == key:
+        return _backup_frequency_cache["value"]
+
+    value = 30
+    try:
+        # Parse Environment="HYTALE_BACKUP_FREQUENCY=30"
+        match = _BACKUP_FREQUENCY_RE.search(HYTALE_OVERRIDE_FILE.read_bytes())
+        if match:
+            value = int(match.group(1))
+    except (PermissionError, ValueError, OSError):
+        return 30
+    _backup_frequency_cache["key"] = key
+    _backup_frequency_cache["value"] = value
+    return value
 
 
 def build_override_content(frequency: int) -> str:
@@ -1663,12 +2188,21 @@ Environment="HYTALE_BACKUP_FREQUENCY={frequency}"
 """
 
 
+_ALLOWED_FREQUENCIES_JSON = json.dumps(ALLOWED_FREQUENCIES, separators=(",", ":")).encode()
+_config_body_cache: dict = {"frequency": None, "body": None}
+
+
 @app.get("/api/config")
 async def api_config(user: str = Depends(verify_credentials)):
-    return JSONResponse({
-        "backup_frequency": get_backup_frequency(),
-        "allowed_frequencies": ALLOWED_FREQUENCIES,
-    })
+    freq = await run_blocking(get_backup_frequency)
+    # Only the frequency varies; splice it into the pre-encoded constant part
+    if _config_body_cache["frequency"] != freq:
+        _config_body_cache["body"] = (
+            b'{"backup_frequency":' + str(freq).encode()
+            + b',"allowed_frequencies":' + _ALLOWED_FREQUENCIES_JSON + b"}"
+        )
+        _config_body_cache["frequency"] = freq
+    return Response(_config_body_cache["body"], media_type="application/json")
 
 
 @app.post("/api/config/backup-frequency")
@@ -1684,28 +2218,41 @@ async def api_set_backup_frequency(request: Request, user: str = Depends(verify_
     # Build override content (only sets Environment, not ExecStart)
     override_content = build_override_content(freq)
 
-    # Create override directory
-    output, rc = run_cmd(["sudo", "/bin/mkdir", "-p", str(HYTALE_OVERRIDE_DIR)])
-    if rc != 0:
-        raise HTTPException(status_code=500, detail=f"Fehler beim Erstellen des Override-Verzeichnisses: {output}")
-
-    # Write override file via sudo tee
+    # sudoers only grants these exact commands (see install.sh), so they
+    # cannot be folded into one "sudo sh -c"; skip the write when unchanged.
     try:
-        proc = subprocess.run(
-            ["sudo", "/usr/bin/tee", str(HYTALE_OVERRIDE_FILE)],
-            input=override_content, capture_output=True, text=True, timeout=10
-        )
-        if proc.returncode != 0:
-            raise HTTPException(status_code=500, detail=f"Fehler beim Schreiben der Override-Datei: {proc.stderr}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        current = await run_blocking(HYTALE_OVERRIDE_FILE.read_text)
+    except OSError:
+        current = None
 
-    # Reload systemd and restart hytale
-    output, rc = run_cmd(["sudo", "/bin/systemctl", "daemon-reload"], timeout=10)
+    if current != override_content:
+        # Create override directory
+        if not HYTALE_OVERRIDE_DIR.is_dir():
+            output, rc = await run_cmd_async(["sudo", "/bin/mkdir", "-p", str(HYTALE_OVERRIDE_DIR)])
+            if rc != 0:
+                raise HTTPException(status_code=500, detail=f"Fehler beim Erstellen des Override-Verzeichnisses: {output}")
+
+        # Write override file via sudo tee
+        try:
+            proc = await asyncio.to_thread(
+                subprocess.run,
+                ["sudo", "/usr/bin/tee", str(HYTALE_OVERRIDE_FILE)],
+                input=override_content, capture_output=True, text=True, timeout=10
+            )
+            if proc.returncode != 0:
+                raise HTTPException(status_code=500, detail=f"Fehler beim Schreiben der Override-Datei: {proc.stderr}")
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    # Reload systemd so the restart picks up the new Environment. Always run:
+    # a retry after a failed reload finds the file already up to date.
+    output, rc = await run_cmd_async(["sudo", "/bin/systemctl", "daemon-reload"], timeout=10)
     if rc != 0:
         raise HTTPException(status_code=500, detail=f"daemon-reload fehlgeschlagen: {output}")
 
-    output, rc = run_cmd(["sudo", "/bin/systemctl", "restart", SERVICE_NAME], timeout=60)
+    output, rc = await run_cmd_async(["sudo", "/bin/systemctl", "restart", SERVICE_NAME], timeout=60)
     if rc != 0:
         raise HTTPException(status_code=500, detail=f"Server-Neustart fehlgeschlagen: {output}")
 
@@ -1715,9 +2262,43 @@ async def api_set_backup_frequency(request: Request, user: str = Depends(verify_
 # ---------------------------------------------------------------------------
 # Version / Update Endpoints
 # ---------------------------------------------------------------------------
+_version_body_cache: dict = {"info": None, "body": None, "etag": None}
+
+
 @app.get("/api/version")
-async def api_version(user: str = Depends(verify_credentials)):
-    return JSONResponse(get_version_info())
+async def api_version(request: Request, user: str = Depends(verify_credentials)):
+    info = get_version_info()
+    # get_version_info hands out the same dict until its TTL expires, so the
+    # encoded body and ETag only need rebuilding when the object changes
+    if _version_body_cache["info"] is not info:
+        _version_body_cache["body"], _version_body_cache["etag"] = _json_body(info)
+        _version_body_cache["info"] = info
+    return _etag_response(request, _version_body_cache["body"], _version_body_cache["etag"])
+
+
+_UPDATE_PROCESS_NEEDLES = (b"hytale-update.sh", b"hytale-downloader")
+
+
+def _is_update_running() -> bool:
+    """Scan /proc cmdlines for the updater, like pgrep -f without the fork."""
+    try:
+        it = os.scandir("/proc")
+    except OSError:
+        return False
+    own_pid = str(os.getpid())
+    with it:
+        for entry in it:
+            if not entry.name.isdigit() or entry.name == own_pid:
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    data = f.read()
+            except OSError:
+                # Process exited mid-scan or is not readable
+                continue
+            if any(n in data for n in _UPDATE_PROCESS_NEEDLES):
+                return True
+    return False
 
 
 @app.get("/api/update/log")
@@ -1726,21 +2307,13 @@ async def api_update_log(user: str = Depends(verify_credentials)):
     log_file = SERVER_DIR / ".downloader" / "download.log"
     log_content = ""
     try:
-        if log_file.exists():
-            log_content = log_file.read_text()
+        # Read off the event loop; a missing log lands in OSError
+        log_content = await run_blocking(log_file.read_text)
     except (PermissionError, OSError):
         pass
 
     # Check if update/downloader process is currently running
-    running = False
-    try:
-        result = subprocess.run(
-            ["pgrep", "-f", "hytale-update.sh|hytale-downloader"],
-            capture_output=True, text=True, timeout=5
-        )
-        running = result.returncode == 0
-    except Exception:
-        pass
+    running = await run_blocking(_is_update_running)
 
     return JSONResponse({
         "log": log_content,
@@ -1753,7 +2326,8 @@ async def api_version_check(user: str = Depends(verify_credentials)):
     if not ALLOW_CONTROL:
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert. ALLOW_CONTROL=true setzen.")
 
-    output, rc = await asyncio.to_thread(run_cmd, with_optional_sudo([UPDATE_SCRIPT, "check"]), 300)
+    output, rc = await run_cmd_async(with_optional_sudo([UPDATE_SCRIPT, "check"]), timeout=300)
+    get_version_info.cache_clear()
     if rc != 0:
         raise HTTPException(status_code=500, detail=output)
 
@@ -1773,7 +2347,8 @@ async def api_update_run(user: str = Depends(verify_credentials)):
     if not ALLOW_CONTROL:
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert. ALLOW_CONTROL=true setzen.")
 
-    output, rc = await asyncio.to_thread(run_cmd, with_optional_sudo([UPDATE_SCRIPT, "update"]), 600)
+    output, rc = await run_cmd_async(with_optional_sudo([UPDATE_SCRIPT, "update"]), timeout=600)
+    get_version_info.cache_clear()
     if rc != 0:
         raise HTTPException(status_code=500, detail=output)
 
@@ -1796,11 +2371,13 @@ async def api_update_auto(user: str = Depends(verify_credentials)):
     if UPDATE_AFTER_BACKUP_FLAG.exists():
         # Toggle off
         UPDATE_AFTER_BACKUP_FLAG.unlink(missing_ok=True)
+        get_version_info.cache_clear()
         return {"ok": True, "update_after_backup": False}
     else:
         # Toggle on: store current backup count
         count = get_backup_count()
         UPDATE_AFTER_BACKUP_FLAG.write_text(str(count))
+        get_version_info.cache_clear()
         return {"ok": True, "update_after_backup": True}
 
 
@@ -1809,7 +2386,8 @@ async def api_update_auto(user: str = Depends(verify_credentials)):
 # ---------------------------------------------------------------------------
 
 # Cache for player data
-_players_cache: dict = {"data": None, "ts": 0}
+_players_cache: dict = {"data": None, "ts": 0, "body": None, "etag": None}
+_players_cache_lock = asyncio.Lock()
 
 
 def _get_players_data() -> dict:
@@ -1818,15 +2396,20 @@ def _get_players_data() -> dict:
 
 
 @app.get("/api/players")
-async def api_players(user: str = Depends(verify_credentials)):
+async def api_players(request: Request, user: str = Depends(verify_credentials)):
     """Get player list from SQLite database."""
-    now = time.time()
     # SQLite reads are fast, 5s cache is sufficient
-    if _players_cache["data"] is None or now - _players_cache["ts"] > 5:
-        loop = asyncio.get_event_loop()
-        _players_cache["data"] = await loop.run_in_executor(_executor, _get_players_data)
-        _players_cache["ts"] = now
-    return JSONResponse(_players_cache["data"])
+    if _players_cache["data"] is None or time.time() - _players_cache["ts"] > 5:
+        # One refresh in flight; callers arriving meanwhile reuse its result
+        async with _players_cache_lock:
+            if _players_cache["data"] is None or time.time() - _players_cache["ts"] > 5:
+                _players_cache["data"] = await run_blocking(_get_players_data)
+                _players_cache["ts"] = time.time()
+                _players_cache["body"] = None
+    # Encode and hash once per refresh, not once per poll
+    if _players_cache["body"] is None:
+        _players_cache["body"], _players_cache["etag"] = _json_body(_players_cache["data"])
+    return _etag_response(request, _players_cache["body"], _players_cache["etag"])
 
 
 @app.post("/api/players/op")
@@ -1886,19 +2469,66 @@ def _get_console_output(since: str = "") -> list:
     return output.splitlines() if rc == 0 else [f"[Fehler: {output}]"]
 
 
+CONSOLE_CACHE_TTL = 1.0
+_CONSOLE_CACHE_MAX = 64
+_console_cache: dict[str, tuple[float, list]] = {}
+_console_locks: dict[str, asyncio.Lock] = {}
+
+
+async def _get_console_output_cached(since: str) -> list:
+    """Share one journalctl run per since value between concurrent pollers."""
+    cached = _console_cache.get(since)
+    if cached and time.monotonic() - cached[0] < CONSOLE_CACHE_TTL:
+        return cached[1]
+    lock = _console_locks.setdefault(since, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed while we waited
+        cached = _console_cache.get(since)
+        now = time.monotonic()
+        if cached and now - cached[0] < CONSOLE_CACHE_TTL:
+            return cached[1]
+        lines = await run_blocking(_get_console_output, since)
+        if len(_console_cache) >= _CONSOLE_CACHE_MAX:
+            # since is client-supplied; drop expired keys so it stays bounded
+            for key in [k for k, (ts, _) in _console_cache.items() if now - ts >= CONSOLE_CACHE_TTL]:
+                _console_cache.pop(key, None)
+                stale_lock = _console_locks.get(key)
+                if key != since and stale_lock and not stale_lock.locked():
+                    del _console_locks[key]
+        _console_cache[since] = (time.monotonic(), lines)
+        return lines
+
+
 @app.get("/api/console/output")
 async def api_console_output(user: str = Depends(verify_credentials), since: str = ""):
     """Return recent log lines from journalctl."""
-    loop = asyncio.get_event_loop()
-    lines = await loop.run_in_executor(_executor, _get_console_output, since)
+    lines = await _get_console_output_cached(since)
     return JSONResponse({"lines": lines})
 
 
+# Configs above this size are validated in a worker thread
+_CONFIG_INLINE_VALIDATE_MAX = 256_000
+
+
+async def _save_json_config(path: Path, content: str) -> None:
+    """Validate content as JSON, then write it unchanged to path."""
+    try:
+        if isinstance(content, str) and len(content) > _CONFIG_INLINE_VALIDATE_MAX:
+            await run_blocking(json.loads, content)
+        else:
+            json.loads(content)  # validate JSON
+    except (json.JSONDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Ungueltiges JSON: {e}")
+    try:
+        await run_blocking(path.write_text, content)
+    except (PermissionError, OSError) as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/config/server")
-async def api_config_server_get(user: str = Depends(verify_credentials)):
+async def api_config_server_get(request: Request, user: str = Depends(verify_credentials)):
     try:
-        content = SERVER_CONFIG_FILE.read_text()
-        return JSONResponse({"content": content})
+        return await _config_file_response(request, SERVER_CONFIG_FILE)
     except (PermissionError, OSError) as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1909,22 +2539,14 @@ async def api_config_server_set(request: Request, user: str = Depends(verify_cre
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert.")
     body = await request.json()
     content = body.get("content", "")
-    try:
-        json.loads(content)  # validate JSON
-    except (json.JSONDecodeError, ValueError) as e:
-        raise HTTPException(status_code=400, detail=f"Ungueltiges JSON: {e}")
-    try:
-        SERVER_CONFIG_FILE.write_text(content)
-    except (PermissionError, OSError) as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await _save_json_config(SERVER_CONFIG_FILE, content)
     return {"ok": True}
 
 
 @app.get("/api/config/world")
-async def api_config_world_get(user: str = Depends(verify_credentials)):
+async def api_config_world_get(request: Request, user: str = Depends(verify_credentials)):
     try:
-        content = WORLD_CONFIG_FILE.read_text()
-        return JSONResponse({"content": content})
+        return await _config_file_response(request, WORLD_CONFIG_FILE)
     except (PermissionError, OSError) as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1935,51 +2557,96 @@ async def api_config_world_set(request: Request, user: str = Depends(verify_cred
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert.")
     body = await request.json()
     content = body.get("content", "")
-    try:
-        json.loads(content)
-    except (json.JSONDecodeError, ValueError) as e:
-        raise HTTPException(status_code=400, detail=f"Ungueltiges JSON: {e}")
-    try:
-        WORLD_CONFIG_FILE.write_text(content)
-    except (PermissionError, OSError) as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    await _save_json_config(WORLD_CONFIG_FILE, content)
     return {"ok": True}
 
 
-@app.get("/api/backups/list")
-async def api_backups_list(user: str = Depends(verify_credentials)):
+# Caps concurrent archive reads during seed extraction
+_SEED_EXTRACT_CONCURRENCY = 4
+
+
+async def _resolve_backup_seeds(entries: list[tuple[Path, str]]) -> list[str | None]:
+    """Resolve seeds for several backups concurrently (bounded).
+
+    Newly extracted seeds are persisted in a single transaction at the end.
+    """
+    sem = asyncio.Semaphore(_SEED_EXTRACT_CONCURRENCY)
+    pending_rows: list[tuple] = []
+
+    async def resolve(path: Path, backup_type: str) -> str | None:
+        async with sem:
+            return await run_blocking(get_backup_seed, path, backup_type, False, pending_rows)
+
+    seeds = await asyncio.gather(*(resolve(p, t) for p, t in entries))
+    if pending_rows:
+        await run_blocking(set_backup_seeds_in_db, pending_rows)
+    return seeds
+
+
+def _newest(items: list, limit: int | None, key) -> list:
+    """Newest-first slice; heapq keeps it O(n log k) when a limit is given."""
+    if limit is None:
+        return sorted(items, key=key, reverse=True)
+    return heapq.nlargest(limit, items, key=key)
+
+
+def list_backup_entries(limit: int | None = None) -> tuple[list[dict], list[tuple[Path, str]]]:
+    """Backup and update-backup listing entries, newest first, seeds unresolved.
+
+    With a limit, only that many entries of each kind are read and returned.
+    """
     result = []
+    seed_sources: list[tuple[Path, str]] = []
     # Regular backups
     try:
-        if BACKUP_DIR.exists():
-            for f in sorted(BACKUP_DIR.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True):
-                if f.is_file() and (f.suffix in (".gz", ".zip")):
-                    st = f.stat()
-                    meta = read_backup_metadata(f)
-                    result.append({
-                        "name": f.name, "size": human_size(st.st_size),
-                        "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
-                        "seed": get_backup_seed(f, "backup") or "unknown",
-                        "label": meta.get("label", ""),
-                        "comment": meta.get("comment", ""),
-                        "source": meta.get("source", ""),
-                        "type": "backup", "path": str(f),
-                    })
+        archives = []
+        with os.scandir(BACKUP_DIR) as it:
+            for e in it:
+                if e.name.endswith((".gz", ".zip")) and e.is_file():
+                    archives.append((e.stat(), e))
+        # Sidecar and seed lookups below only run for the entries kept here
+        for st, e in _newest(archives, limit, key=lambda item: item[0].st_mtime):
+            f = Path(e.path)
+            meta = read_backup_metadata(f)
+            result.append({
+                "name": e.name, "size": human_size(st.st_size),
+                "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
+                "seed": None,
+                "label": meta.get("label", ""),
+                "comment": meta.get("comment", ""),
+                "source": meta.get("source", ""),
+                "type": "backup", "path": e.path,
+            })
+            seed_sources.append((f, "backup"))
     except (PermissionError, OSError):
         pass
     # Update backups
     try:
-        for d in sorted(SERVER_DIR.glob(".update_backup_*"), reverse=True):
-            if d.is_dir():
-                st = d.stat()
-                result.append({
-                    "name": d.name, "size": "-",
-                    "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
-                    "seed": get_backup_seed(d, "update-backup") or "unknown",
-                    "type": "update-backup", "path": str(d),
-                })
+        with os.scandir(SERVER_DIR) as it:
+            update_dirs = [e for e in it if e.name.startswith(".update_backup_") and e.is_dir()]
+        for e in _newest(update_dirs, limit, key=lambda e: e.name):
+            st = e.stat()
+            result.append({
+                "name": e.name, "size": "-",
+                "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
+                "seed": None,
+                "type": "update-backup", "path": e.path,
+            })
+            seed_sources.append((Path(e.path), "update-backup"))
     except (PermissionError, OSError):
         pass
+    return result, seed_sources
+
+
+@app.get("/api/backups/list")
+async def api_backups_list(user: str = Depends(verify_credentials), limit: int | None = None):
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit muss mindestens 1 sein.")
+    result, seed_sources = await run_blocking(list_backup_entries, limit)
+    # Cold caches mean one archive decompression per backup; overlap them.
+    seeds = await _resolve_backup_seeds(seed_sources)
+    for entry, seed in zip(result, seeds):
+        entry["seed"] = seed or "unknown"
     return JSONResponse({"backups": result})
 
 
@@ -2016,7 +2683,7 @@ async def api_backup_restore(request: Request, user: str = Depends(verify_creden
         raise HTTPException(status_code=400, detail="Ungueltiger Backup-Typ.")
 
     mode = "full" if include_server_state else "world"
-    output, rc = await asyncio.to_thread(run_cmd, with_optional_sudo([RESTORE_SCRIPT, str(backup_path), mode]), 900)
+    output, rc = await run_cmd_async(with_optional_sudo([RESTORE_SCRIPT, str(backup_path), mode]), timeout=900)
     if rc != 0:
         raise HTTPException(status_code=500, detail=output or "Restore fehlgeschlagen.")
 
@@ -2054,7 +2721,7 @@ async def api_backup_seed_refresh(request: Request, user: str = Depends(verify_c
     else:
         raise HTTPException(status_code=400, detail="Ungueltiger Backup-Typ.")
 
-    seed = await asyncio.to_thread(get_backup_seed, backup_path, backup_type, True)
+    seed = await run_blocking(get_backup_seed, backup_path, backup_type, True)
     return JSONResponse({"ok": True, "seed": seed or "unknown"})
 
 
@@ -2069,33 +2736,70 @@ async def api_backup_delete(filename: str, user: str = Depends(verify_credential
     if not target.exists():
         raise HTTPException(status_code=404, detail="Datei nicht gefunden.")
     try:
+        # Update backups are full world copies; delete off the event loop
         if target.is_dir():
-            shutil.rmtree(target)
+            await run_blocking(shutil.rmtree, target)
         else:
-            target.unlink()
+            await run_blocking(target.unlink)
     except (PermissionError, OSError) as e:
         raise HTTPException(status_code=500, detail=str(e))
     return {"ok": True}
 
 
-@app.get("/api/mods")
-async def api_mods(user: str = Depends(verify_credentials)):
+_dir_size_cache: dict[str, tuple[int, int]] = {}
+
+
+def _dir_size(path: str) -> int:
+    """Total size of regular files below path, without following dir symlinks."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.is_file():
+                        total += e.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def get_mod_dirs() -> list[dict]:
     mods = []
     try:
-        if MODS_DIR.exists():
-            for d in sorted(MODS_DIR.iterdir()):
-                if d.is_dir():
-                    enabled = not d.name.endswith(".disabled")
-                    display_name = d.name.removesuffix(".disabled")
-                    has_manifest = (d / "manifest.json").exists()
-                    total_size = sum(f.stat().st_size for f in d.rglob("*") if f.is_file())
-                    mods.append({
-                        "name": display_name, "dir_name": d.name,
-                        "enabled": enabled, "has_manifest": has_manifest,
-                        "size": human_size(total_size),
-                    })
-    except (PermissionError, OSError):
-        pass
+        with os.scandir(MODS_DIR) as it:
+            entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except OSError:
+        return mods
+    for e in entries:
+        enabled = not e.name.endswith(".disabled")
+        display_name = e.name.removesuffix(".disabled")
+        has_manifest = os.path.exists(os.path.join(e.path, "manifest.json"))
+        # Mods are replaced as whole directories, so the dir mtime is a
+        # good enough key to skip re-walking the tree on every listing
+        try:
+            mtime = e.stat().st_mtime_ns
+        except OSError:
+            continue
+        cached = _dir_size_cache.get(e.path)
+        if cached and cached[0] == mtime:
+            total_size = cached[1]
+        else:
+            total_size = _dir_size(e.path)
+            _dir_size_cache[e.path] = (mtime, total_size)
+        mods.append({
+            "name": display_name, "dir_name": e.name,
+            "enabled": enabled, "has_manifest": has_manifest,
+            "size": human_size(total_size),
+        })
+    return mods
+
+
+@app.get("/api/mods")
+async def api_mods(user: str = Depends(verify_credentials)):
+    mods = await run_blocking(get_mod_dirs)
     return JSONResponse({"mods": mods})
 
 
@@ -2128,12 +2832,47 @@ async def api_mod_delete(name: str, user: str = Depends(verify_credentials)):
     if not target.exists() or not target.is_dir():
         raise HTTPException(status_code=404, detail="Mod nicht gefunden.")
     try:
-        shutil.rmtree(target)
+        await run_blocking(shutil.rmtree, target)
     except (PermissionError, OSError) as e:
         raise HTTPException(status_code=500, detail=str(e))
+    _dir_size_cache.pop(str(target), None)
     return {"ok": True}
 
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def _write_upload(upload, out, first: bytes) -> None:
+    """Copy an upload to an open binary file chunk by chunk, off the event loop."""
+    chunk = first
+    while chunk:
+        await run_blocking(out.write, chunk)
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+
+
+def _extract_mod_zip(zip_path: str, filename: str) -> str:
+    """Extract an uploaded mod ZIP into mods/ and return the mod name."""
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        # Determine mod name from zip content
+        names = zf.namelist()
+        top_dirs = set()
+        for n in names:
+            parts = n.split("/")
+            if len(parts) > 1 and parts[0]:
+                top_dirs.add(parts[0])
+
+        if len(top_dirs) == 1:
+            mod_name = top_dirs.pop()
+            extract_to = MODS_DIR
+        else:
+            mod_name = Path(filename).stem
+            extract_to = MODS_DIR / mod_name
+            extract_to.mkdir(parents=True, exist_ok=True)
+
+        zf.extractall(str(extract_to))
+    return mod_name
+
+
 @app.post("/api/mods/upload")
 async def api_mod_upload(request: Request, user: str = Depends(verify_credentials)):
     if not ALLOW_CONTROL:
@@ -2141,15 +2880,15 @@ async def api_mod_upload(request: Request, user: str = Depends(verify_credential
 
     from fastapi import UploadFile, File
     import tempfile
-    import zipfile
 
     form = await request.form()
     file = form.get("file")
     if not file:
         raise HTTPException(status_code=400, detail="Keine Datei hochgeladen.")
 
-    content = await file.read()
-    if not content:
+    # Stream the upload to disk in chunks instead of buffering it whole
+    first = await file.read(UPLOAD_CHUNK_SIZE)
+    if not first:
         raise HTTPException(status_code=400, detail="Leere Datei.")
 
     filename = file.filename or "mod"
@@ -2161,33 +2900,25 @@ async def api_mod_upload(request: Request, user: str = Depends(verify_credential
         mod_dir = MODS_DIR / mod_name
         mod_dir.mkdir(parents=True, exist_ok=True)
         jar_path = mod_dir / filename
-        jar_path.write_bytes(content)
+        # Stream into a .part sibling and publish with an atomic rename, so
+        # a failed or in-flight upload never leaves a partial JAR behind
+        part_path = mod_dir / f"{filename}.part"
+        try:
+            with open(part_path, "wb") as out:
+                await _write_upload(file, out, first)
+            await run_blocking(os.replace, part_path, jar_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
         return {"ok": True, "mod_name": mod_name}
 
     # ZIP file handling
     with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-        tmp.write(content)
         tmp_path = tmp.name
+        await _write_upload(file, tmp, first)
 
     try:
-        with zipfile.ZipFile(tmp_path, "r") as zf:
-            # Determine mod name from zip content
-            names = zf.namelist()
-            top_dirs = set()
-            for n in names:
-                parts = n.split("/")
-                if len(parts) > 1 and parts[0]:
-                    top_dirs.add(parts[0])
-
-            if len(top_dirs) == 1:
-                mod_name = top_dirs.pop()
-                extract_to = MODS_DIR
-            else:
-                mod_name = Path(filename).stem
-                extract_to = MODS_DIR / mod_name
-                extract_to.mkdir(parents=True, exist_ok=True)
-
-            zf.extractall(str(extract_to))
+        mod_name = await run_blocking(_extract_mod_zip, tmp_path, filename)
     except zipfile.BadZipFile:
         raise HTTPException(status_code=400, detail="Ungueltige ZIP-Datei.")
     finally:
@@ -2242,22 +2973,40 @@ PLUGIN_STORE = [
 ]
 
 
-@app.get("/api/plugins")
-async def api_plugins(user: str = Depends(verify_credentials)):
-    """List available plugins from the store with install status."""
+_plugins_cache = {"mtime": None, "data": None}
+
+
+def get_plugin_states() -> list[dict]:
+    """Store plugins with install status, cached until mods/ changes."""
+    try:
+        mtime = MODS_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None and _plugins_cache["mtime"] == mtime:
+        return _plugins_cache["data"]
+
+    # Installs, toggles and removals all rename or unlink inside mods/,
+    # which bumps its mtime; one listing answers every plugin below.
+    try:
+        with os.scandir(MODS_DIR) as it:
+            names = [e.name for e in it]
+    except OSError:
+        names = []
+    name_set = set(names)
+
     result = []
     for plugin in PLUGIN_STORE:
         installed = False
         enabled = False
         # Check for JAR file in mods/ root (new method)
         jar_name = plugin["url"].split("/")[-1]
-        jar_base = jar_name.replace(".jar", "")
-        jars = list(MODS_DIR.glob(f"{jar_base.split('-')[0]}*.jar"))
-        disabled_jars = list(MODS_DIR.glob(f"{jar_base.split('-')[0]}*.jar.disabled"))
+        prefix = jar_name.replace(".jar", "").split("-")[0]
+        jars = any(n.startswith(prefix) and n.endswith(".jar") for n in names)
+        disabled_jars = any(n.startswith(prefix) and n.endswith(".jar.disabled") for n in names)
         # Also check for old-style directory installation (backwards compat)
         dir_name = plugin["dir_name"]
-        dir_exists = (MODS_DIR / dir_name).exists()
-        dir_disabled = (MODS_DIR / f"{dir_name}.disabled").exists()
+        dir_exists = dir_name in name_set
+        dir_disabled = f"{dir_name}.disabled" in name_set
 
         if jars or dir_exists:
             installed = True
@@ -2270,9 +3019,22 @@ async def api_plugins(user: str = Depends(verify_credentials)):
             "installed": installed,
             "enabled": enabled,
         })
+    _plugins_cache["mtime"] = mtime
+    _plugins_cache["data"] = result
+    return result
+
+
+@app.get("/api/plugins")
+async def api_plugins(user: str = Depends(verify_credentials)):
+    """List available plugins from the store with install status."""
+    result = await run_blocking(get_plugin_states)
     return JSONResponse({"plugins": result})
 
 
+PLUGIN_DOWNLOAD_TIMEOUT = 60
+PLUGIN_DOWNLOAD_CHUNK = 1 << 20
+
+
 @app.post("/api/plugins/{plugin_id}/install")
 async def api_plugin_install(plugin_id: str, user: str = Depends(verify_credentials)):
     """Download and install a plugin from the store."""
@@ -2296,8 +3058,6 @@ async def api_plugin_install(plugin_id: str, user: str = Depends(verify_credenti
                     detail=f"Abhaengigkeit fehlt: {dep['name']}. Bitte zuerst installieren."
                 )
 
-    import urllib.request
-
     jar_name = plugin["url"].split("/")[-1]
     jar_path = MODS_DIR / jar_name
     disabled_jar_path = MODS_DIR / f"{jar_name}.disabled"
@@ -2309,18 +3069,25 @@ async def api_plugin_install(plugin_id: str, user: str = Depends(verify_credenti
     if (MODS_DIR / dir_name).exists() or (MODS_DIR / f"{dir_name}.disabled").exists():
         raise HTTPException(status_code=400, detail="Plugin bereits installiert.")
 
+    part_path = MODS_DIR / f"{jar_name}.part"
     try:
-        # Download JAR directly to mods/ root (not in subdirectory)
+        # Download JAR directly to mods/ root (not in subdirectory). Stream into
+        # a .part sibling and rename once complete, so the plugin scan never
+        # sees a half-written JAR.
         def download():
-            urllib.request.urlretrieve(plugin["url"], str(jar_path))
+            with urllib.request.urlopen(plugin["url"], timeout=PLUGIN_DOWNLOAD_TIMEOUT) as resp, \
+                    open(part_path, "wb") as out:
+                shutil.copyfileobj(resp, out, PLUGIN_DOWNLOAD_CHUNK)
+            os.replace(part_path, jar_path)
 
-        await asyncio.to_thread(download)
+        await run_blocking(download)
 
         # Create config directory if plugin has config_port setting
         if "config_port" in plugin:
             config_dir = MODS_DIR / dir_name
             config_dir.mkdir(parents=True, exist_ok=True)
     except Exception as e:
+        part_path.unlink(missing_ok=True)
         if jar_path.exists():
             jar_path.unlink()
         raise HTTPException(status_code=500, detail=f"Download fehlgeschlagen: {e}")
@@ -2328,77 +3095,206 @@ async def api_plugin_install(plugin_id: str, user: str = Depends(verify_credenti
     return {"ok": True, "plugin": plugin["name"]}
 
 
-@app.get("/api/server/query")
-async def api_server_query(user: str = Depends(verify_credentials)):
-    """Get server status from Nitrado Query API (if installed)."""
+class _LoginRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Turn the WebServer's redirect to its login page into a 401."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if "/login" in newurl:
+            raise urllib.error.HTTPError(req.full_url, 401, "WebServer requires login", headers, fp)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_query_opener() -> urllib.request.OpenerDirector:
+    """Opener for the local WebServer, built once.
+
+    The plugin uses a self-signed cert, so verification is off. A bare
+    client context skips loading the system CA store, which is what made
+    create_default_context() expensive on every probe.
+    """
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return urllib.request.build_opener(_LoginRedirectHandler, urllib.request.HTTPSHandler(context=ctx))
+
+
+def _query_nitrado() -> dict:
+    """Probe the Nitrado Query API; all blocking steps in one worker call."""
     # Check for plugin JAR files (they can be either in root or subdirectories)
     query_jar = list(MODS_DIR.glob("nitrado-query*.jar"))
     webserver_jar = list(MODS_DIR.glob("nitrado-webserver*.jar"))
 
     if not query_jar or not webserver_jar:
-        return JSONResponse({"available": False, "reason": "Nitrado:Query oder Nitrado:WebServer nicht installiert."})
+        return {"available": False, "reason": "Nitrado:Query oder Nitrado:WebServer nicht installiert."}
 
     # Read WebServer config to get port (config is in Nitrado_WebServer folder)
     config_path = MODS_DIR / "Nitrado_WebServer" / "config.json"
     port = 5523  # default: game port (5520) + 3
-    if config_path.exists():
-        try:
-            cfg = json.loads(config_path.read_text())
-            port = cfg.get("port", port)
-        except Exception:
-            pass
-
     try:
-        import urllib.request
-        import urllib.error
-        import ssl
-
-        # Skip SSL verification for self-signed cert
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
+        cfg = json.loads(config_path.read_bytes())
+        port = cfg.get("port", port)
+    except Exception:
+        pass
 
+    try:
         url = f"https://127.0.0.1:{port}/Nitrado/Query"
         req = urllib.request.Request(url, headers={"Accept": "application/json"})
-
-        def fetch():
-            # Use a custom redirect handler to detect auth redirects
-            class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
-                def redirect_request(self, req, fp, code, msg, headers, newurl):
-                    if "/login" in newurl:
-                        raise urllib.error.HTTPError(req.full_url, 401, "WebServer requires login", headers, fp)
-                    return super().redirect_request(req, fp, code, msg, headers, newurl)
-
-            opener = urllib.request.build_opener(NoRedirectHandler, urllib.request.HTTPSHandler(context=ctx))
-            with opener.open(req, timeout=5) as resp:
-                return json.loads(resp.read().decode())
-
-        data = await asyncio.to_thread(fetch)
-        return JSONResponse({"available": True, "data": data})
+        with _get_query_opener().open(req, timeout=5) as resp:
+            data = json.loads(resp.read())
+        return {"available": True, "data": data}
     except urllib.error.HTTPError as e:
         if e.code == 401:
-            return JSONResponse({"available": False, "reason": "WebServer Login erforderlich. Erstelle ein Spieler-Passwort im Spiel mit /webserver password <passwort>"})
-        return JSONResponse({"available": False, "reason": str(e)})
+            return {"available": False, "reason": "WebServer Login erforderlich. Erstelle ein Spieler-Passwort im Spiel mit /webserver password <passwort>"}
+        return {"available": False, "reason": str(e)}
     except urllib.error.URLError as e:
         if "Connection refused" in str(e):
-            return JSONResponse({"available": False, "reason": "WebServer nicht erreichbar (Server läuft?)"})
-        return JSONResponse({"available": False, "reason": str(e)})
+            return {"available": False, "reason": "WebServer nicht erreichbar (Server läuft?)"}
+        return {"available": False, "reason": str(e)}
     except Exception as e:
-        return JSONResponse({"available": False, "reason": str(e)})
+        return {"available": False, "reason": str(e)}
+
+
+@app.get("/api/server/query")
+async def api_server_query(user: str = Depends(verify_credentials)):
+    """Get server status from Nitrado Query API (if installed)."""
+    return JSONResponse(await run_blocking(_query_nitrado))
 
 
 # ---------------------------------------------------------------------------
 # CurseForge Integration
 # ---------------------------------------------------------------------------
-CF_API_BASE = "https://api.curseforge.com/v1"
+CF_API_HOST = "api.curseforge.com"
+CF_API_BASE = f"https://{CF_API_HOST}/v1"
 CF_HYTALE_GAME_ID = None  # Will be discovered dynamically
+CF_REQUEST_TIMEOUT = 15
+CF_DOWNLOAD_CHUNK = 1 << 20
+# Keep-alive connections to the API host, reused across requests
+CF_POOL_SIZE = 4
+_cf_conns: queue.SimpleQueue = queue.SimpleQueue()
+# Errors that mean a pooled connection was closed by the server while idle
+_CF_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError)
+
+
+@functools.lru_cache(maxsize=1)
+def _cf_ssl_context() -> ssl.SSLContext:
+    # Loading the CA store is the costly part; do it once
+    return ssl.create_default_context()
+
+
+@contextlib.contextmanager
+def _cf_connection():
+    """Borrow a pooled HTTPS connection; it goes back only if the caller succeeded."""
+    try:
+        conn = _cf_conns.get_nowait()
+    except queue.Empty:
+        conn = http.client.HTTPSConnection(
+            CF_API_HOST, timeout=CF_REQUEST_TIMEOUT, context=_cf_ssl_context()
+        )
+    ok = False
+    try:
+        yield conn
+        ok = True
+    finally:
+        if ok and _cf_conns.qsize() < CF_POOL_SIZE:
+            _cf_conns.put(conn)
+        else:
+            conn.close()
+
+
+def _cf_fetch(url: str, headers: dict, etag: str | None = None) -> tuple[dict | None, str | None]:
+    """GET a CurseForge API URL over a pooled connection.
+
+    With an etag the request is conditional; a 304 returns (None, etag).
+    """
+    path = url.removeprefix(f"https://{CF_API_HOST}")
+    if etag:
+        headers = {**headers, "If-None-Match": etag}
+    for attempt in range(2):
+        try:
+            with _cf_connection() as conn:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                # Always drain the body so the connection can be reused
+                body = resp.read()
+        except _CF_STALE_ERRORS:
+            if attempt:
+                raise
+            continue
+        if resp.status == 304 and etag:
+            return None, resp.getheader("ETag") or etag
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        # json.loads detects the encoding of raw bytes; no separate decode pass
+        return json.loads(body), resp.getheader("ETag")
+
+
+def _cf_get(url: str, headers: dict) -> dict:
+    """GET a CurseForge API URL over a pooled connection and decode the JSON."""
+    return _cf_fetch(url, headers)[0]
+
+
+CF_CACHE_TTL = 300
+_CF_CACHE_MAX = 512
+# "<key hash> <url>" -> (fetched_at, payload, etag); expired entries stay
+# for revalidation
+_cf_cache: dict[str, tuple[float, dict, str | None]] = {}
+_cf_inflight: dict[str, asyncio.Future] = {}
+# Result handed to waiters when the request doing the fetch was cancelled
+_CF_RETRY = object()
 
 
-async def cf_request(endpoint: str, params: dict = None) -> dict:
-    """Make a request to the CurseForge API."""
-    import urllib.request
-    import urllib.parse
+async def _cf_cached_get(url: str, headers: dict) -> dict:
+    """Read-only CurseForge GET with a TTL cache and single-flight misses.
 
+    Entries are per API key, so changing or revoking the key in the settings
+    never serves responses fetched with the old one.
+    """
+    key_hash = hashlib.blake2b(headers["x-api-key"].encode(), digest_size=8).hexdigest()
+    cache_key = f"{key_hash} {url}"
+    while True:
+        hit = _cf_cache.get(cache_key)
+        if hit and time.monotonic() - hit[0] < CF_CACHE_TTL:
+            return hit[1]
+        pending = _cf_inflight.get(cache_key)
+        if pending is None:
+            break
+        data = await asyncio.shield(pending)
+        if data is not _CF_RETRY:
+            return data
+        # The request that owned the fetch was cancelled; fetch it ourselves
+
+    fut = asyncio.get_running_loop().create_future()
+    _cf_inflight[cache_key] = fut
+    try:
+        data, etag = await run_blocking(_cf_fetch, url, headers, hit[2] if hit else None)
+        if data is None:
+            # 304 Not Modified: keep the payload that is already parsed
+            data = hit[1]
+    except asyncio.CancelledError:
+        # Only this request was cancelled; let the waiters retry instead
+        fut.set_result(_CF_RETRY)
+        raise
+    except Exception as exc:
+        fut.set_exception(exc)
+        fut.exception()  # waiters re-raise it; don't warn when there are none
+        raise
+    finally:
+        _cf_inflight.pop(cache_key, None)
+    fut.set_result(data)
+    if _cf_cache.pop(cache_key, None) is None and len(_cf_cache) >= _CF_CACHE_MAX:
+        # Dicts keep insertion order, so this drops the oldest entry
+        _cf_cache.pop(next(iter(_cf_cache)))
+    _cf_cache[cache_key] = (time.monotonic(), data, etag)
+    return data
+
+
+async def cf_request(endpoint: str, params: dict = None, cache: bool = True) -> dict:
+    """Make a request to the CurseForge API.
+
+    Reads are cached for CF_CACHE_TTL seconds; pass cache=False for lookups
+    that must be fresh, such as the file info used by an install.
+    """
     if not get_cf_api_key():
         raise HTTPException(status_code=500, detail="CurseForge API Key nicht konfiguriert (CF_API_KEY)")
 
@@ -2406,16 +3302,27 @@ async def cf_request(endpoint: str, params: dict = None) -> dict:
     if params:
         url += "?" + urllib.parse.urlencode(params)
 
-    req = urllib.request.Request(url, headers={
+    headers = {
         "Accept": "application/json",
         "x-api-key": get_cf_api_key(),
-    })
+    }
+    if cache:
+        return await _cf_cached_get(url, headers)
+    return await run_blocking(_cf_get, url, headers)
 
-    def fetch():
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode())
 
-    return await asyncio.to_thread(fetch)
+def _persist_cf_game_id(game_id: int) -> None:
+    # Merge into the file's raw contents, not load_config(): that adds the
+    # env API key, which must not be written to disk
+    try:
+        with open(DASHBOARD_CONFIG_FILE, "r") as f:
+            config = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+    config["cf_hytale_game_id"] = game_id
+    save_config(config)
 
 
 async def get_hytale_game_id() -> int:
@@ -2424,16 +3331,33 @@ async def get_hytale_game_id() -> int:
     if CF_HYTALE_GAME_ID:
         return CF_HYTALE_GAME_ID
 
+    # Persisted by an earlier run, so cold starts skip the catalog fetch
+    stored_id = load_config().get("cf_hytale_game_id")
+    if isinstance(stored_id, int):
+        CF_HYTALE_GAME_ID = stored_id
+        return CF_HYTALE_GAME_ID
+
     # Fetch all games and find Hytale
     data = await cf_request("/games")
     for game in data.get("data", []):
         if game.get("slug") == "hytale" or game.get("name", "").lower() == "hytale":
             CF_HYTALE_GAME_ID = game["id"]
+            await run_blocking(_persist_cf_game_id, CF_HYTALE_GAME_ID)
             return CF_HYTALE_GAME_ID
 
     raise HTTPException(status_code=500, detail="Hytale nicht in CurseForge gefunden")
 
 
+_EMPTY_AUTHOR = ({"name": "Unknown"},)
+_EMPTY_DICT: dict = {}
+
+
+def _cf_author(mod: dict) -> str:
+    """First author's name, without allocating a default list per mod."""
+    authors = mod.get("authors") or _EMPTY_AUTHOR
+    return authors[0].get("name", "Unknown")
+
+
 @app.get("/api/curseforge/status")
 async def api_cf_status(user: str = Depends(verify_credentials)):
     """Check if CurseForge integration is configured and working."""
@@ -2470,18 +3394,19 @@ async def api_cf_search(
             params["classId"] = category
 
         data = await cf_request("/mods/search", params)
-        mods = []
-        for mod in data.get("data", []):
-            mods.append({
+        mods = [
+            {
                 "id": mod["id"],
                 "name": mod["name"],
                 "slug": mod["slug"],
                 "summary": mod.get("summary", ""),
-                "author": mod.get("authors", [{}])[0].get("name", "Unknown"),
+                "author": _cf_author(mod),
                 "downloads": mod.get("downloadCount", 0),
-                "icon": mod.get("logo", {}).get("thumbnailUrl", ""),
+                "icon": (mod.get("logo") or _EMPTY_DICT).get("thumbnailUrl", ""),
                 "updated": mod.get("dateModified", ""),
-            })
+            }
+            for mod in data.get("data", ())
+        ]
         return JSONResponse({
             "mods": mods,
             "total": data.get("pagination", {}).get("totalCount", 0),
@@ -2496,32 +3421,34 @@ async def api_cf_search(
 async def api_cf_mod(mod_id: int, user: str = Depends(verify_credentials)):
     """Get details and files for a specific mod."""
     try:
-        # Get mod info
-        mod_data = await cf_request(f"/mods/{mod_id}")
+        # Mod info and file list are independent; fetch both at once
+        mod_data, files_data = await asyncio.gather(
+            cf_request(f"/mods/{mod_id}"),
+            cf_request(f"/mods/{mod_id}/files", {"pageSize": 50}),
+        )
         mod = mod_data.get("data", {})
 
-        # Get files
-        files_data = await cf_request(f"/mods/{mod_id}/files", {"pageSize": 50})
-        files = []
-        for f in files_data.get("data", []):
-            files.append({
+        files = [
+            {
                 "id": f["id"],
                 "name": f["fileName"],
                 "version": f.get("displayName", f["fileName"]),
                 "size": f.get("fileLength", 0),
                 "date": f.get("fileDate", ""),
                 "download_url": f.get("downloadUrl", ""),
-                "game_versions": f.get("gameVersions", []),
-            })
+                "game_versions": f.get("gameVersions", ()),
+            }
+            for f in files_data.get("data", ())
+        ]
 
         return JSONResponse({
             "id": mod["id"],
             "name": mod["name"],
             "summary": mod.get("summary", ""),
             "description": mod.get("description", ""),  # HTML
-            "author": mod.get("authors", [{}])[0].get("name", "Unknown"),
+            "author": _cf_author(mod),
             "downloads": mod.get("downloadCount", 0),
-            "icon": mod.get("logo", {}).get("thumbnailUrl", ""),
+            "icon": (mod.get("logo") or _EMPTY_DICT).get("thumbnailUrl", ""),
             "files": files,
         })
     except HTTPException:
@@ -2536,18 +3463,16 @@ async def api_cf_install(mod_id: int, file_id: int, user: str = Depends(verify_c
     if not ALLOW_CONTROL:
         raise HTTPException(status_code=403, detail="Control-Aktionen deaktiviert.")
 
-    import urllib.request
-
     try:
         # Get file info
-        file_data = await cf_request(f"/mods/{mod_id}/files/{file_id}")
+        file_data = await cf_request(f"/mods/{mod_id}/files/{file_id}", cache=False)
         file_info = file_data.get("data", {})
         file_name = file_info.get("fileName", f"mod_{mod_id}_{file_id}.jar")
         download_url = file_info.get("downloadUrl")
 
         if not download_url:
             # Some mods require fetching download URL separately
-            url_data = await cf_request(f"/mods/{mod_id}/files/{file_id}/download-url")
+            url_data = await cf_request(f"/mods/{mod_id}/files/{file_id}/download-url", cache=False)
             download_url = url_data.get("data")
 
         if not download_url:
@@ -2555,15 +3480,23 @@ async def api_cf_install(mod_id: int, file_id: int, user: str = Depends(verify_c
 
         # Download file
         target_path = MODS_DIR / file_name
+        part_path = MODS_DIR / f"{file_name}.part"
 
         def download():
             req = urllib.request.Request(download_url, headers={
                 "x-api-key": get_cf_api_key(),
             })
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                target_path.write_bytes(resp.read())
+            # Stream to a .part sibling in fixed-size chunks so memory stays
+            # flat for large mods, then publish with an atomic rename
+            try:
+                with urllib.request.urlopen(req, timeout=60) as resp, open(part_path, "wb") as out:
+                    shutil.copyfileobj(resp, out, CF_DOWNLOAD_CHUNK)
+                os.replace(part_path, target_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
 
-        await asyncio.to_thread(download)
+        await run_blocking(download)
 
         return {"ok": True, "file": file_name, "path": str(target_path)}
     except HTTPException:
@@ -2599,7 +3532,7 @@ async def update_settings(request: Request, _: HTTPBasicCredentials = Depends(ve
     if "cf_api_key" in body and body["cf_api_key"] != "***":
         config["cf_api_key"] = body["cf_api_key"]
 
-    if save_config(config):
+    if await run_blocking(save_config, config):
         return {"ok": True, "message": "Einstellungen gespeichert / Settings saved"}
     else:
         raise HTTPException(status_code=500, detail="Speichern fehlgeschlagen / Save failed")
@@ -2616,20 +3549,18 @@ async def check_cf_status(_: HTTPBasicCredentials = Depends(verify_credentials))
             "message": "Kein API-Key konfiguriert / No API key configured"
         }
 
-    # Test the API key
-    import urllib.request
+    # Test the API key with a one-item page over a pooled connection; the
+    # full games catalog is not needed to know the key is accepted
     try:
-        req = urllib.request.Request(
-            "https://api.curseforge.com/v1/games",
-            headers={"Accept": "application/json", "x-api-key": api_key}
+        await run_blocking(
+            _cf_get,
+            f"{CF_API_BASE}/games?pageSize=1",
+            {"Accept": "application/json", "x-api-key": api_key},
         )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            if resp.status == 200:
-                return {"valid": True, "message": "API-Key gueltig / API key valid"}
     except Exception as e:
         return {
             "valid": False,
             "message": f"API-Key ungueltig / API key invalid: {str(e)}"
         }
 
-    return {"valid": False, "message": "Unbekannter Fehler / Unknown error"}
+    return {"valid": True, "message": "API-Key gueltig / API key valid"}
@@ -5,6 +5,7 @@ Tests to ensure that no dangerous commands can be executed via the console
 that could harm the host system.
 """
 
+import os
 import sys
 import re
 from pathlib import Path
@@ -13,7 +14,27 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Import the validation function and constants
-from app import should_allow_console_command, BLOCKED_CONSOLE_COMMANDS, MAX_COMMAND_LENGTH
+from app import should_allow_console_command, BLOCKED_CONSOLE_COMMANDS, MAX_COMMAND_LENGTH, DANGEROUS_PATTERNS
+
+# Per-case lines are buffered and written once; pass -v or set VERBOSE=1
+# to stream them as the tests run.
+VERBOSE = "-v" in sys.argv[1:] or bool(os.environ.get("VERBOSE"))
+_log_lines = []
+
+
+def log(line=""):
+    """Record one line of per-case test output."""
+    if VERBOSE:
+        print(line)
+    else:
+        _log_lines.append(line)
+
+
+def flush_log():
+    """Write any buffered per-case output in a single call."""
+    if _log_lines:
+        sys.stdout.write("\n".join(_log_lines) + "\n")
+        _log_lines.clear()
 
 
 def test_basic_valid_commands():
@@ -31,12 +52,12 @@ def test_basic_valid_commands():
         "list",
     ]
     
-    print("Testing valid commands...")
+    log("Testing valid commands...")
     for cmd in valid_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert is_allowed, f"Valid command '{cmd}' was blocked: {error}"
-        print(f"  ✓ '{cmd}' - allowed")
-    print()
+        log(f"  ✓ '{cmd}' - allowed")
+    log()
 
 
 def test_blocked_commands():
@@ -56,13 +77,13 @@ def test_blocked_commands():
         "plugin load test",
     ]
     
-    print("Testing blocked commands...")
+    log("Testing blocked commands...")
     for cmd in blocked_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert not is_allowed, f"Blocked command '{cmd}' was allowed"
         assert error, f"No error message for blocked command '{cmd}'"
-        print(f"  ✓ '{cmd}' - blocked: {error}")
-    print()
+        log(f"  ✓ '{cmd}' - blocked: {error}")
+    log()
 
 
 def test_shell_metacharacters():
@@ -80,14 +101,14 @@ def test_shell_metacharacters():
         "say test\rshutdown",
     ]
     
-    print("Testing shell metacharacters...")
+    log("Testing shell metacharacters...")
     for cmd in dangerous_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert not is_allowed, f"Command with shell metacharacters '{cmd}' was allowed"
         assert "metacharacters" in error.lower() or "forbidden characters" in error.lower(), \
             f"Wrong error for '{cmd}': {error}"
-        print(f"  ✓ Blocked: {cmd[:50]}... - {error}")
-    print()
+        log(f"  ✓ Blocked: {cmd[:50]}... - {error}")
+    log()
 
 
 def test_path_traversal():
@@ -99,12 +120,12 @@ def test_path_traversal():
         "help ../",
     ]
     
-    print("Testing path traversal attempts...")
+    log("Testing path traversal attempts...")
     for cmd in path_traversal_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert not is_allowed, f"Path traversal command '{cmd}' was allowed"
-        print(f"  ✓ Blocked: {cmd} - {error}")
-    print()
+        log(f"  ✓ Blocked: {cmd} - {error}")
+    log()
 
 
 def test_system_paths():
@@ -120,12 +141,12 @@ def test_system_paths():
         "help /opt/other-app",
     ]
     
-    print("Testing system path access...")
+    log("Testing system path access...")
     for cmd in system_path_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert not is_allowed, f"System path command '{cmd}' was allowed"
-        print(f"  ✓ Blocked: {cmd} - {error}")
-    print()
+        log(f"  ✓ Blocked: {cmd} - {error}")
+    log()
 
 
 def test_dangerous_system_commands():
@@ -153,13 +174,52 @@ def test_dangerous_system_commands():
         "list service nginx stop",
     ]
     
-    print("Testing dangerous system commands...")
+    log("Testing dangerous system commands...")
     for cmd in dangerous_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert not is_allowed, f"Dangerous command '{cmd}' was allowed"
         assert "forbidden pattern" in error.lower(), f"Wrong error for '{cmd}': {error}"
-        print(f"  ✓ Blocked: {cmd} - Forbidden pattern detected")
-    print()
+        log(f"  ✓ Blocked: {cmd} - Forbidden pattern detected")
+    log()
+
+
+def test_forbidden_pattern_reported():
+    """Test that the rejection names the dangerous pattern that matched."""
+    cases = [
+        ("say please sudo now", r"\bsudo\b"),
+        ("say ../secret", r"\.\./"),
+        ("help /opt/other-app", r"/opt/(?!hytale-server)"),
+        ("say systemctl status", r"\bsystemctl\b"),
+    ]
+    
+    log("Testing forbidden pattern reporting...")
+    for cmd, pattern in cases:
+        is_allowed, error = should_allow_console_command(cmd)
+        assert not is_allowed, f"Dangerous command '{cmd}' was allowed"
+        assert error.endswith(pattern), f"Wrong pattern reported for '{cmd}': {error}"
+        log(f"  ✓ '{cmd}' - reported {pattern}")
+    log()
+
+
+def test_fused_patterns_match_individual():
+    """Test that the fused pattern scan agrees with each DANGEROUS_PATTERNS entry."""
+    words = ["say", "rm", "rmdir", "sudo", "pseudo", "kill", "skill", "su", "suspend",
+             "mkfs", "cp", "checkpoint", "init", "/etc/", "/opt/hytale-server/x",
+             "/opt/other", "../", "/var/log", "service", "microservice", "dd", "add"]
+    # Every pair of words covers single hits, double hits and near misses
+    commands = [f"say {a} {b}" for a in words for b in words]
+    
+    log("Testing fused pattern scan against individual patterns...")
+    for cmd in commands:
+        lower = cmd.lower()
+        matching = {p.pattern for p in DANGEROUS_PATTERNS if p.search(lower)}
+        is_allowed, error = should_allow_console_command(cmd)
+        assert is_allowed == (not matching), f"Mismatch for '{cmd}': {error}"
+        if matching:
+            reported = error.removeprefix("Command contains forbidden pattern: ")
+            assert reported in matching, f"Unexpected pattern for '{cmd}': {error}"
+    log(f"  ✓ {len(commands)} commands agree with per-pattern checks")
+    log()
 
 
 def test_word_boundary_false_positives():
@@ -174,54 +234,56 @@ def test_word_boundary_false_positives():
         "say Adding more features",      # Contains 'dd' but should be allowed
     ]
     
-    print("Testing word boundary (no false positives)...")
+    log("Testing word boundary (no false positives)...")
     for cmd in valid_commands_with_substrings:
         is_allowed, error = should_allow_console_command(cmd)
         assert is_allowed, f"Valid command '{cmd}' was incorrectly blocked: {error}"
-        print(f"  ✓ '{cmd}' - allowed (substring not matched)")
-    print()
+        log(f"  ✓ '{cmd}' - allowed (substring not matched)")
+    log()
 
 
 def test_command_length():
     """Test that overly long commands are rejected."""
-    print("Testing command length limits...")
+    log("Testing command length limits...")
     
     # Test maximum allowed length
     max_cmd = "say " + "A" * (MAX_COMMAND_LENGTH - 4)
     is_allowed, error = should_allow_console_command(max_cmd)
     assert is_allowed, f"Command at max length was blocked: {error}"
-    print(f"  ✓ Command at max length ({MAX_COMMAND_LENGTH}) - allowed")
+    log(f"  ✓ Command at max length ({MAX_COMMAND_LENGTH}) - allowed")
     
     # Test exceeding maximum length
     too_long_cmd = "say " + "A" * MAX_COMMAND_LENGTH
     is_allowed, error = should_allow_console_command(too_long_cmd)
     assert not is_allowed, "Command exceeding max length was allowed"
     assert "too long" in error.lower(), f"Wrong error for long command: {error}"
-    print(f"  ✓ Command exceeding max length - blocked: {error}")
-    print()
+    log(f"  ✓ Command exceeding max length - blocked: {error}")
+    log()
 
 
 def test_empty_and_null():
-    """Test that empty commands and null bytes are rejected."""
-    print("Testing empty commands and null bytes...")
+    """Test that empty commands, null bytes and control characters are rejected."""
+    log("Testing empty commands, null bytes and control characters...")
     
     invalid_commands = [
         "",
         "   ",
         "\x00",
         "say test\x00malicious",
+        "say test\tmalicious",
+        "say \x1b[2Jcleared",
     ]
     
     for cmd in invalid_commands:
         is_allowed, error = should_allow_console_command(cmd)
         assert not is_allowed, f"Invalid command '{repr(cmd)}' was allowed"
-        print(f"  ✓ Blocked: {repr(cmd)} - {error}")
-    print()
+        log(f"  ✓ Blocked: {repr(cmd)} - {error}")
+    log()
 
 
 def test_edge_cases():
     """Test edge cases and unusual inputs."""
-    print("Testing edge cases...")
+    log("Testing edge cases...")
     
     edge_cases = [
         ("SAY HELLO", True),  # Uppercase should work
@@ -234,16 +296,16 @@ def test_edge_cases():
         is_allowed, error = should_allow_console_command(cmd)
         if should_allow:
             assert is_allowed, f"Valid edge case '{cmd}' was blocked: {error}"
-            print(f"  ✓ '{cmd}' - allowed (edge case)")
+            log(f"  ✓ '{cmd}' - allowed (edge case)")
         else:
             assert not is_allowed, f"Invalid edge case '{cmd}' was allowed"
-            print(f"  ✓ '{cmd}' - blocked: {error}")
-    print()
+            log(f"  ✓ '{cmd}' - blocked: {error}")
+    log()
 
 
 def test_send_console_command_validation():
     """Test the defense-in-depth validation in send_console_command."""
-    print("Testing send_console_command validation...")
+    log("Testing send_console_command validation...")
     
     # Import the function
     from app import send_console_command, MAX_COMMAND_LENGTH, CONSOLE_PIPE
@@ -257,11 +319,11 @@ def test_send_console_command_validation():
             CONSOLE_PIPE.parent.mkdir(parents=True, exist_ok=True)
             os.mkfifo(str(CONSOLE_PIPE))
             pipe_created = True
-            print(f"  ℹ Created temporary test pipe at {CONSOLE_PIPE}")
+            log(f"  ℹ Created temporary test pipe at {CONSOLE_PIPE}")
         except Exception as e:
-            print(f"  ⚠ Could not create test pipe: {e}")
-            print(f"  ⚠ Skipping send_console_command tests")
-            print()
+            log(f"  ⚠ Could not create test pipe: {e}")
+            log(f"  ⚠ Skipping send_console_command tests")
+            log()
             return
     
     try:
@@ -271,7 +333,7 @@ def test_send_console_command_validation():
             assert False, "send_console_command should reject null bytes"
         except RuntimeError as e:
             assert "null bytes" in str(e).lower()
-            print(f"  ✓ Null byte rejected: {e}")
+            log(f"  ✓ Null byte rejected: {e}")
         
         # Test length limit
         try:
@@ -280,22 +342,22 @@ def test_send_console_command_validation():
             assert False, "send_console_command should reject overly long commands"
         except RuntimeError as e:
             assert "too long" in str(e).lower()
-            print(f"  ✓ Long command rejected: {e}")
+            log(f"  ✓ Long command rejected: {e}")
         
         # Note: We can't fully test UTF-8 encoding without actual FIFO reader,
         # but the error handling path exists
-        print(f"  ✓ UTF-8 encoding validation in place (strict mode)")
+        log(f"  ✓ UTF-8 encoding validation in place (strict mode)")
         
     finally:
         # Clean up temporary pipe if we created it
         if pipe_created and CONSOLE_PIPE.exists():
             try:
                 CONSOLE_PIPE.unlink()
-                print(f"  ℹ Cleaned up temporary test pipe")
+                log(f"  ℹ Cleaned up temporary test pipe")
             except Exception as e:
-                print(f"  ⚠ Could not remove test pipe: {e}")
+                log(f"  ⚠ Could not remove test pipe: {e}")
     
-    print()
+    log()
 
 
 def run_all_tests():
@@ -312,18 +374,22 @@ def run_all_tests():
         test_path_traversal()
         test_system_paths()
         test_dangerous_system_commands()
+        test_forbidden_pattern_reported()
+        test_fused_patterns_match_individual()
         test_word_boundary_false_positives()
         test_command_length()
         test_empty_and_null()
         test_edge_cases()
         test_send_console_command_validation()
         
+        flush_log()
         print("=" * 70)
         print("ALL TESTS PASSED ✓")
         print("=" * 70)
         return 0
         
     except AssertionError as e:
+        flush_log()
         print()
         print("=" * 70)
         print("TEST FAILED ✗")
@@ -331,6 +397,7 @@ def run_all_tests():
         print("=" * 70)
         return 1
     except Exception as e:
+        flush_log()
         print()
         print("=" * 70)
         print("UNEXPECTED ERROR ✗")
@@ -6,15 +6,18 @@ Collects metrics and player events, stores in SQLite for fast dashboard access.
 Run as systemd service: hytale-dashboard-worker.service
 """
 
+import contextlib
 import sqlite3
 import subprocess
+import threading
 import time
 import re
 import os
 import signal
 import sys
+from collections import Counter, deque
 from pathlib import Path
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
 # Configuration
 DB_PATH = Path(__file__).parent / "data" / "dashboard.db"
@@ -23,6 +26,7 @@ PERF_INTERVAL = 5      # Collect performance every 5 seconds
 PLAYER_INTERVAL = 10   # Check player events every 10 seconds
 CLEANUP_INTERVAL = 3600  # Cleanup old data every hour
 PERF_RETENTION_HOURS = 24  # Keep 24h of performance history
+PERF_LOG_LINES = 200   # Recent log lines scanned for TPS/view radius
 
 # Docker mode detection
 DOCKER_MODE = os.environ.get("DOCKER_MODE", "false").lower() == "true"
@@ -31,22 +35,41 @@ if HYTALE_CONTAINER:
     DOCKER_MODE = True
 if not DOCKER_MODE and Path("/.dockerenv").exists():
     DOCKER_MODE = True
+# Docker commands need a container name; without one the native path is used
+_USE_DOCKER = bool(DOCKER_MODE and HYTALE_CONTAINER)
+
+# Log patterns. Each combines two alternatives so a line is searched once.
+_PERF_RE = re.compile(
+    rb"Setting TPS of world \w+ to (?P<tps>\d+)"
+    rb"|(?:Initial view radius is|View radius.*?to) (?P<vr>\d+)"
+)
+# Join is tried before leave, each with its own greedy prefix, as the two
+# separate searches did. Log lines are matched as undecoded bytes.
+_EVENT_RE = re.compile(
+    rb"(?P<ts>\d{4}-\d{2}-\d{2}T\S+)"
+    rb"(?:.*Adding player '(?P<jname>[^']+)' to world '(?P<jworld>[^']+)' at location .+\((?P<juuid>[a-f0-9-]+)\)"
+    rb"|.*Removing player '(?P<lname>[^']+?)(?:\s*\([^)]+\))?'.*\((?P<luuid>[a-f0-9-]+)\)\s*$)"
+)
 
 # Globals
 running = True
-last_log_position = ""
+# Set on shutdown so the main loop's timed wait returns at once
+_shutdown = threading.Event()
 
 
 def signal_handler(sig, frame):
     global running
     print(f"[Worker] Received signal {sig}, shutting down...")
     running = False
+    _shutdown.set()
 
 
 def init_db():
     """Initialize SQLite database with schema."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
+    # Only takes effect while the file is still empty (new installs)
+    conn.execute("PRAGMA page_size=8192")
     c = conn.cursor()
 
     # Players table
@@ -82,8 +105,17 @@ def init_db():
     except sqlite3.OperationalError:
         pass  # Column already exists
 
-    # Create index for faster queries
-    c.execute("CREATE INDEX IF NOT EXISTS idx_perf_ts ON performance(timestamp)")
+    # Covering index for the dashboard's reads (latest sample, history by
+    # time range): they are answered from index pages without touching the
+    # table. Each insert maintains a wider index entry, which is cheap at
+    # one row per PERF_INTERVAL. It also serves the cleanup range delete,
+    # so the timestamp-only index it supersedes is dropped.
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_perf_ts_cov ON performance(
+            timestamp, tps, cpu_percent, ram_mb, ram_percent, view_radius, players_online
+        )
+    """)
+    c.execute("DROP INDEX IF EXISTS idx_perf_ts")
 
     # Player events log
     c.execute("""
@@ -111,28 +143,184 @@ def init_db():
     print(f"[Worker] Database initialized: {DB_PATH}")
 
 
-def run_cmd(cmd: list, timeout: int = 10) -> tuple:
-    """Run subprocess and return (output, returncode)."""
+def run_cmd(cmd: list, timeout: int = 10, text: bool = True) -> tuple:
+    """Run subprocess and return (output, returncode).
+
+    With text=False the output stays undecoded bytes, for log reads that are
+    only regex-matched.
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        result = subprocess.run(cmd, capture_output=True, text=text, timeout=timeout)
         return result.stdout.strip(), result.returncode
     except Exception as e:
-        return str(e), 1
+        return str(e) if text else str(e).encode(), 1
+
+
+@contextlib.contextmanager
+def stream_cmd(cmd: list, timeout: int = 60):
+    """Run cmd and yield the process; iterate proc.stdout for byte lines.
+
+    Unlike run_cmd the output is never held in memory as a whole. The
+    process is killed after timeout seconds. Raises OSError if it can't start.
+    """
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL)
+    timer = threading.Timer(timeout, proc.kill)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield proc
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+
+def get_logs_docker(lines: int = 200) -> bytes:
+    """Get recent logs from docker logs."""
+    output, rc = run_cmd(["docker", "logs", "--tail", str(lines), HYTALE_CONTAINER], text=False)
+    return output if rc == 0 else b""
+
+
+def get_logs_native(lines: int = 200) -> bytes:
+    """Get recent logs from journalctl."""
+    output, rc = run_cmd(["journalctl", "-u", SERVICE_NAME, f"-n{lines}", "--no-pager", "-q"], text=False)
+    return output if rc == 0 else b""
+
+
+def events_query_docker(since_ts: str) -> list:
+    """Catch-up log query for check_player_events (docker logs)."""
+    # No --since support, get more lines
+    return ["docker", "logs", "--tail", "1000", HYTALE_CONTAINER]
+
+
+def events_query_native(since_ts: str) -> list:
+    """Catch-up log query for check_player_events (journalctl --since)."""
+    return ["journalctl", "-u", SERVICE_NAME, "--no-pager", "-o", "short-iso", "--since", since_ts]
+
 
+# The mode never changes at runtime, so pick each variant once
+get_logs = get_logs_docker if _USE_DOCKER else get_logs_native
+events_query_cmd = events_query_docker if _USE_DOCKER else events_query_native
 
-def get_logs(lines: int = 200) -> str:
-    """Get recent logs from journalctl or docker logs."""
-    if DOCKER_MODE and HYTALE_CONTAINER:
-        cmd = ["docker", "logs", "--tail", str(lines), HYTALE_CONTAINER]
+
+# Persistent `journalctl -f` / `docker logs -f` child: each cycle reads only
+# the lines logged since the last one instead of re-running a tail.
+_follower = {"proc": None, "buf": b"", "pending": [], "catchup": True}
+_recent_lines = deque(maxlen=PERF_LOG_LINES)
+
+
+def start_log_follower() -> bool:
+    """Spawn the log follower and seed the recent-lines window."""
+    if _USE_DOCKER:
+        cmd = ["docker", "logs", "-f", "--tail", "0", HYTALE_CONTAINER]
     else:
-        cmd = ["journalctl", "-u", SERVICE_NAME, f"-n{lines}", "--no-pager", "-q"]
-    output, rc = run_cmd(cmd)
-    return output if rc == 0 else ""
+        cmd = ["journalctl", "-u", SERVICE_NAME, "-f", "-n0", "--no-pager", "-q", "-o", "short-iso"]
+    try:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(f"[Worker] Log follower failed to start: {e}")
+        return False
+    os.set_blocking(proc.stdout.fileno(), False)
+    _follower.update(proc=proc, buf=b"", pending=[], catchup=True)
+    _recent_lines.clear()
+    _recent_lines.extend(get_logs(PERF_LOG_LINES).splitlines())
+    return True
+
+
+def stop_log_follower():
+    proc = _follower["proc"]
+    _follower.update(proc=None, buf=b"", pending=[], catchup=True)
+    if proc is None:
+        return
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    proc.stdout.close()
+
+
+def drain_log_follower() -> bool:
+    """Read whatever the follower has buffered; restart it if it exited.
+
+    Returns False when no follower is running.
+    """
+    proc = _follower["proc"]
+    if proc is None:
+        return start_log_follower()
+
+    chunks = []
+    eof = False
+    while True:
+        try:
+            data = os.read(proc.stdout.fileno(), 65536)
+        except BlockingIOError:
+            break
+        if not data:
+            eof = True
+            break
+        chunks.append(data)
+
+    if chunks:
+        *complete, _follower["buf"] = (_follower["buf"] + b"".join(chunks)).split(b"\n")
+        _follower["pending"].extend(complete)
+        _recent_lines.extend(complete[-PERF_LOG_LINES:])
+
+    if eof:
+        # journalctl exited or the container stopped; the next call restarts
+        # it, and check_player_events catches up with a one-shot query
+        stop_log_follower()
+        return False
+    return True
+
+
+# (pid, starttime) of the last Java process found; starttime guards
+# against the PID having been reused by another process
+_java_pid_cache = None
+
+
+def _proc_starttime(pid: str) -> str | None:
+    """Start time field of /proc/<pid>/stat, or None if the process is gone."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces; the fields after it are plain
+    fields = stat.rpartition(b")")[2].split()
+    return fields[19].decode() if len(fields) > 19 else None
 
 
 def get_java_pid() -> str | None:
-    """Find the Java process PID for Hytale server."""
-    if DOCKER_MODE and HYTALE_CONTAINER:
+    """Find the Java process PID for Hytale server.
+
+    The PID only changes when the server restarts, so the last one found is
+    reused for as long as that process is alive.
+    """
+    global _java_pid_cache
+    if _java_pid_cache:
+        pid, starttime = _java_pid_cache
+        if _proc_starttime(pid) == starttime:
+            return pid
+        _java_pid_cache = None
+
+    pid = find_java_pid()
+    if pid:
+        starttime = _proc_starttime(pid)
+        if starttime:
+            _java_pid_cache = (pid, starttime)
+    return pid
+
+
+def find_java_pid() -> str | None:
+    """Look up the Java process PID via docker/systemd (uncached)."""
+    if _USE_DOCKER:
         # Docker mode: get PID from docker inspect
         cmd = ["docker", "inspect", "--format", "{{.State.Pid}}", HYTALE_CONTAINER]
         output, rc = run_cmd(cmd)
@@ -160,10 +348,152 @@ def get_java_pid() -> str | None:
     return None
 
 
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+_mem_total_kb = None
+# (pid, cpu_ticks, monotonic) of the previous sample, for interval CPU %
+_last_cpu_sample = None
+
+
+def get_mem_total_kb() -> int | None:
+    """MemTotal from /proc/meminfo (read once)."""
+    global _mem_total_kb
+    if _mem_total_kb is None:
+        try:
+            with open("/proc/meminfo", "rb") as f:
+                for line in f:
+                    if line.startswith(b"MemTotal:"):
+                        _mem_total_kb = int(line.split()[1])
+                        break
+        except (OSError, ValueError, IndexError):
+            return None
+    return _mem_total_kb
+
+
+def get_proc_stats(pid: str) -> dict:
+    """CPU/RAM usage of a process read from /proc, like `ps -o %cpu,%mem,rss`.
+
+    CPU % covers the time since the previous sample (the process lifetime on
+    the first one) and, as with ps, 100 means one full core.
+    """
+    global _last_cpu_sample
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        # Fields after "(comm)": utime=11, stime=12, starttime=19, rss=21
+        fields = stat.rpartition(b")")[2].split()
+        ticks = int(fields[11]) + int(fields[12])
+        rss_kb = int(fields[21]) * _PAGE_SIZE // 1024
+    except (OSError, ValueError, IndexError):
+        return {}
+
+    now = time.monotonic()
+    prev = _last_cpu_sample
+    _last_cpu_sample = (pid, ticks, now)
+    if prev and prev[0] == pid and ticks >= prev[1] and now > prev[2]:
+        cpu_percent = (ticks - prev[1]) / _CLK_TCK / (now - prev[2]) * 100
+    else:
+        try:
+            with open("/proc/uptime", "rb") as f:
+                uptime = float(f.read().split()[0])
+        except (OSError, ValueError, IndexError):
+            return {}
+        elapsed = uptime - int(fields[19]) / _CLK_TCK
+        cpu_percent = ticks / _CLK_TCK / elapsed * 100 if elapsed > 0 else 0.0
+
+    result = {"cpu_percent": round(cpu_percent, 1), "ram_mb": rss_kb / 1024}
+    mem_total_kb = get_mem_total_kb()
+    if mem_total_kb:
+        result["ram_percent"] = round(rss_kb / mem_total_kb * 100, 1)
+    return result
+
+
+CGROUP_RETRY_INTERVAL = 60  # Seconds before retrying an unreadable cgroup
+# cgroup v2 directory of HYTALE_CONTAINER; "retry_at" backs off after a miss
+_container_cgroup = {"path": None, "retry_at": 0.0}
+# (usage_usec, monotonic) of the previous cgroup sample
+_last_cgroup_cpu = None
+
+
+def get_container_cgroup() -> Path | None:
+    """Resolve the container's cgroup v2 directory (docker inspect once)."""
+    if _container_cgroup["path"] is not None:
+        return _container_cgroup["path"]
+    if time.monotonic() < _container_cgroup["retry_at"]:
+        return None
+    output, rc = run_cmd(["docker", "inspect", "--format", "{{.Id}}", HYTALE_CONTAINER])
+    if rc == 0 and output:
+        # systemd cgroup driver first, then cgroupfs
+        for path in (Path(f"/sys/fs/cgroup/system.slice/docker-{output}.scope"),
+                     Path(f"/sys/fs/cgroup/docker/{output}")):
+            if (path / "cpu.stat").exists():
+                _container_cgroup["path"] = path
+                return path
+    _container_cgroup["retry_at"] = time.monotonic() + CGROUP_RETRY_INTERVAL
+    return None
+
+
+def get_cgroup_stats() -> dict | None:
+    """CPU/RAM stats read from the container's cgroup files.
+
+    Returns None when the cgroup is not readable from here (cgroup v1, or
+    the worker itself runs in a container); docker stats is used instead.
+    CPU % needs two samples, so the first call has no cpu_percent.
+    """
+    global _last_cgroup_cpu
+    path = get_container_cgroup()
+    if path is None:
+        return None
+    try:
+        usage_usec = None
+        with open(path / "cpu.stat", "rb") as f:
+            for line in f:
+                if line.startswith(b"usage_usec "):
+                    usage_usec = int(line.split()[1])
+                    break
+        if usage_usec is None:
+            raise ValueError("usage_usec missing from cpu.stat")
+        with open(path / "memory.current", "rb") as f:
+            mem_bytes = int(f.read())
+        inactive_file = 0
+        with open(path / "memory.stat", "rb") as f:
+            for line in f:
+                if line.startswith(b"inactive_file "):
+                    inactive_file = int(line.split()[1])
+                    break
+        with open(path / "memory.max", "rb") as f:
+            mem_max = f.read().strip()
+    except (OSError, ValueError, IndexError):
+        # Container was stopped or recreated; resolve it again
+        _container_cgroup["path"] = None
+        _last_cgroup_cpu = None
+        return None
+
+    # Like docker stats: page cache that can be dropped doesn't count
+    used_bytes = max(mem_bytes - inactive_file, 0)
+    result = {"ram_mb": used_bytes / (1024 * 1024)}
+    limit_kb = int(mem_max) // 1024 if mem_max.isdigit() else get_mem_total_kb()
+    if limit_kb:
+        result["ram_percent"] = round(used_bytes / 1024 / limit_kb * 100, 2)
+
+    now = time.monotonic()
+    prev = _last_cgroup_cpu
+    _last_cgroup_cpu = (usage_usec, now)
+    if prev and usage_usec >= prev[0] and now > prev[1]:
+        # usec of CPU per usec of wall time: 100 means one full core
+        result["cpu_percent"] = round((usage_usec - prev[0]) / ((now - prev[1]) * 1e6) * 100, 2)
+    return result
+
+
 def get_docker_stats() -> dict:
-    """Get CPU/RAM stats from docker stats."""
+    """Get CPU/RAM stats for the container, from its cgroup or docker stats."""
     if not HYTALE_CONTAINER:
         return {}
+    stats = get_cgroup_stats()
+    if stats is not None:
+        return stats
+
+    # docker stats samples twice, a second apart, before it returns
     cmd = ["docker", "stats", "--no-stream", "--format",
            "{{.CPUPerc}}|{{.MemUsage}}|{{.MemPerc}}", HYTALE_CONTAINER]
     output, rc = run_cmd(cmd, timeout=10)
@@ -198,6 +528,8 @@ def get_docker_stats() -> dict:
 
 def collect_performance() -> dict:
     """Collect current performance metrics."""
+    global _java_pid_cache
+
     result = {
         "tps": None,
         "cpu_percent": None,
@@ -207,24 +539,25 @@ def collect_performance() -> dict:
     }
 
     # Get TPS and view_radius from recent logs
-    output = get_logs(200)
-    if output:
-        tps_re = re.compile(r"Setting TPS of world \w+ to (\d+)")
-        vr_re = re.compile(r"(?:Initial view radius is|View radius.*?to) (\d+)")
-        for line in reversed(output.splitlines()):
-            if result["tps"] is None:
-                match = tps_re.search(line)
-                if match:
-                    result["tps"] = int(match.group(1))
-            if result["view_radius"] is None:
-                match = vr_re.search(line)
-                if match:
-                    result["view_radius"] = int(match.group(1))
+    if drain_log_follower():
+        lines = _recent_lines
+    else:
+        lines = get_logs(PERF_LOG_LINES).splitlines()
+    if lines:
+        for line in reversed(lines):
+            match = _PERF_RE.search(line)
+            if not match:
+                continue
+            tps, vr = match.group("tps", "vr")
+            if tps is not None and result["tps"] is None:
+                result["tps"] = int(tps)
+            elif vr is not None and result["view_radius"] is None:
+                result["view_radius"] = int(vr)
             if result["tps"] is not None and result["view_radius"] is not None:
                 break
 
     # Get CPU/RAM - different methods for Docker vs native
-    if DOCKER_MODE and HYTALE_CONTAINER:
+    if _USE_DOCKER:
         # Docker mode: use docker stats
         stats = get_docker_stats()
         if stats:
@@ -232,82 +565,130 @@ def collect_performance() -> dict:
             result["ram_percent"] = stats.get("ram_percent")
             result["ram_mb"] = stats.get("ram_mb")
     else:
-        # Native mode: use ps with Java PID
+        # Native mode: read the Java process's /proc entries
         java_pid = get_java_pid()
         if java_pid:
-            output, rc = run_cmd(["ps", "-p", java_pid, "-o", "%cpu,%mem,rss", "--no-headers"])
-            if rc == 0 and output:
-                try:
-                    parts = output.split()
-                    result["cpu_percent"] = float(parts[0])
-                    result["ram_percent"] = float(parts[1])
-                    result["ram_mb"] = int(parts[2]) / 1024  # KB to MB
-                except (ValueError, IndexError):
-                    pass
+            stats = get_proc_stats(java_pid)
+            if stats:
+                result["cpu_percent"] = stats.get("cpu_percent")
+                result["ram_percent"] = stats.get("ram_percent")
+                result["ram_mb"] = stats.get("ram_mb")
+            else:
+                _java_pid_cache = None  # Process went away; look it up again
 
     return result
 
 
+# Refreshes the stored online count; run in the same transaction as any
+# change to players.online, so save_performance only needs a key lookup.
+_STORE_ONLINE_COUNT_SQL = """
+    INSERT INTO metadata (key, value)
+    SELECT 'players_online', COUNT(*) FROM players WHERE online = 1
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+
 def get_online_player_count(conn) -> int:
     """Get count of online players from DB."""
     c = conn.cursor()
+    c.execute("SELECT value FROM metadata WHERE key = 'players_online'")
+    row = c.fetchone()
+    if row is not None:
+        return int(row[0])
     c.execute("SELECT COUNT(*) FROM players WHERE online = 1")
     return c.fetchone()[0]
 
 
+_PERF_INSERT_SQL = """
+    INSERT INTO performance (timestamp, tps, cpu_percent, ram_mb, ram_percent, view_radius, players_online)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+# Created once per connection and reused every cycle
+_perf_cursor = None
+# Whether the last stored sample was an all-empty (server down) one
+_last_perf_offline = False
+
+
 def save_performance(conn, perf: dict):
-    """Save performance metrics to database."""
-    c = conn.cursor()
-    now = datetime.now(timezone.utc).isoformat()
+    """Save performance metrics to database.
+
+    While the server is down only the first empty sample is stored: it marks
+    the gap (the dashboard shows the latest row), the rest would only bloat
+    the table and its index.
+    """
+    global _perf_cursor, _last_perf_offline
+    offline = perf["tps"] is None and perf["cpu_percent"] is None and perf["ram_mb"] is None
+    if offline and _last_perf_offline:
+        return
+
+    if _perf_cursor is None or _perf_cursor.connection is not conn:
+        _perf_cursor = conn.cursor()
+    # Same ISO-8601 UTC form as datetime.isoformat(), at second resolution,
+    # without building a datetime object
+    now = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
     players_online = get_online_player_count(conn)
 
-    c.execute("""
-        INSERT INTO performance (timestamp, tps, cpu_percent, ram_mb, ram_percent, view_radius, players_online)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (now, perf["tps"], perf["cpu_percent"], perf["ram_mb"], perf["ram_percent"], perf.get("view_radius"), players_online))
+    _perf_cursor.execute(_PERF_INSERT_SQL, (
+        now, perf["tps"], perf["cpu_percent"], perf["ram_mb"], perf["ram_percent"],
+        perf.get("view_radius"), players_online,
+    ))
     conn.commit()
+    _last_perf_offline = offline
 
 
-def parse_player_events(output: str) -> list:
-    """Parse player join/leave events from log output."""
-    events = []
-
-    join_re = re.compile(
-        r"(\d{4}-\d{2}-\d{2}T\S+).*Adding player '([^']+)' to world '([^']+)' at location .+\(([a-f0-9-]+)\)"
-    )
-    leave_re = re.compile(
-        r"(\d{4}-\d{2}-\d{2}T\S+).*Removing player '([^']+?)(?:\s*\([^)]+\))?'.*\(([a-f0-9-]+)\)\s*$"
-    )
-
-    for line in output.splitlines():
-        m = join_re.search(line)
-        if m:
-            events.append({
-                "timestamp": m.group(1),
-                "name": m.group(2),
-                "world": m.group(3),
-                "uuid": m.group(4),
-                "type": "join"
-            })
-            continue
+def parse_player_events(lines):
+    """Yield player join/leave events from an iterable of log lines (bytes).
 
-        m = leave_re.search(line)
-        if m:
-            events.append({
-                "timestamp": m.group(1),
-                "name": m.group(2),
-                "uuid": m.group(3),
+    Only the matched groups are decoded.
+    """
+    for line in lines:
+        m = _EVENT_RE.search(line)
+        if not m:
+            continue
+        if m.group("juuid") is not None:
+            yield {
+                "timestamp": m.group("ts").decode("utf-8", "replace"),
+                "name": m.group("jname").decode("utf-8", "replace"),
+                "world": m.group("jworld").decode("utf-8", "replace"),
+                "uuid": m.group("juuid").decode(),
+                "type": "join"
+            }
+        else:
+            yield {
+                "timestamp": m.group("ts").decode("utf-8", "replace"),
+                "name": m.group("lname").decode("utf-8", "replace"),
+                "uuid": m.group("luuid").decode(),
                 "type": "leave",
                 "world": None
-            })
+            }
+
 
-    return events
+def unseen_player_events(seen: list, lines) -> list:
+    """Events in lines that are newer than the catch-up query's events in seen.
+
+    Everything before the query's last timestamp was in its output; at that
+    timestamp only events it didn't return as well are new.
+    """
+    events = parse_player_events(lines)
+    if not seen:
+        return list(events)
+    last_ts = seen[-1]["timestamp"]
+    at_last = Counter((e["uuid"], e["type"]) for e in seen if e["timestamp"] == last_ts)
+    unseen = []
+    for event in events:
+        if event["timestamp"] < last_ts:
+            continue
+        if event["timestamp"] == last_ts:
+            key = (event["uuid"], event["type"])
+            if at_last[key] > 0:
+                at_last[key] -= 1
+                continue
+        unseen.append(event)
+    return unseen
 
 
 def check_player_events(conn):
     """Check for new player events and update database."""
-    global last_log_position
-
     c = conn.cursor()
 
     # Get last processed timestamp
@@ -315,109 +696,126 @@ def check_player_events(conn):
     row = c.fetchone()
     since_ts = row[0] if row else "3 days ago"
 
-    # Query logs since last check
-    if DOCKER_MODE and HYTALE_CONTAINER:
-        # Docker mode: get recent logs (no --since support, get more lines)
-        cmd = ["docker", "logs", "--tail", "1000", HYTALE_CONTAINER]
-        output, rc = run_cmd(cmd, timeout=30)
+    if drain_log_follower() and not _follower["catchup"]:
+        # Only the lines logged since the previous check
+        events = list(parse_player_events(_follower["pending"]))
+        _follower["pending"] = []
     else:
-        # Native mode: use journalctl with --since
-        cmd = ["journalctl", "-u", SERVICE_NAME, "--no-pager", "-o", "short-iso", "--since", since_ts]
-        output, rc = run_cmd(cmd, timeout=30)
-
-    if rc != 0:
-        return
-
-    events = parse_player_events(output)
+        # Query logs since last check
+        try:
+            with stream_cmd(events_query_cmd(since_ts), timeout=30) as proc:
+                events = list(parse_player_events(proc.stdout))
+                rc = proc.wait()
+        except OSError:
+            return
+
+        if rc != 0:
+            return
+        # The query covered everything drained before it. Lines logged while
+        # it ran are in its output and still unread in the follower pipe:
+        # drain them now and keep only the events the query didn't return.
+        if _follower["proc"] is not None and drain_log_follower():
+            events.extend(unseen_player_events(events, _follower["pending"]))
+            _follower.update(pending=[], catchup=False)
 
     if not events:
         return
 
+    # Fold the batch per player so the statements can run as executemany:
+    # the latest join and leave of each player, and which came last.
+    joins = {}
+    leaves = {}
+    online = {}
+    log_rows = []
     for event in events:
-        # Update players table
+        uuid = event["uuid"]
         if event["type"] == "join":
-            c.execute("""
-                INSERT INTO players (uuid, name, online, last_login, world)
-                VALUES (?, ?, 1, ?, ?)
-                ON CONFLICT(uuid) DO UPDATE SET
-                    name = excluded.name,
-                    online = 1,
-                    last_login = excluded.last_login,
-                    world = excluded.world
-            """, (event["uuid"], event["name"], event["timestamp"], event["world"]))
+            joins[uuid] = (uuid, event["name"], event["timestamp"], event["world"])
+            online[uuid] = 1
         else:  # leave
-            c.execute("""
-                UPDATE players SET online = 0, last_logout = ?
-                WHERE uuid = ?
-            """, (event["timestamp"], event["uuid"]))
+            leaves[uuid] = event["timestamp"]
+            online[uuid] = 0
+        log_rows.append((event["timestamp"], uuid, event["name"], event["type"], event["world"]))
 
-        # Log event
-        c.execute("""
+    # Update last processed timestamp
+    latest_ts = events[-1]["timestamp"]
+
+    # One write transaction for the whole batch; IMMEDIATE takes the write
+    # lock up front instead of upgrading from a read lock midway.
+    begin_immediate(conn)
+    with conn:
+        c.executemany("""
+            INSERT INTO players (uuid, name, online, last_login, world)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(uuid) DO UPDATE SET
+                name = excluded.name,
+                online = 1,
+                last_login = excluded.last_login,
+                world = excluded.world
+        """, joins.values())
+        # Runs after the joins, so a rejoin later in the batch stays online
+        c.executemany("""
+            UPDATE players SET online = ?, last_logout = ?
+            WHERE uuid = ?
+        """, [(online[uuid], ts, uuid) for uuid, ts in leaves.items()])
+
+        # Log events
+        c.executemany("""
             INSERT INTO player_events (timestamp, uuid, name, event_type, world)
             VALUES (?, ?, ?, ?, ?)
-        """, (event["timestamp"], event["uuid"], event["name"], event["type"], event["world"]))
+        """, log_rows)
 
-    # Update last processed timestamp
-    latest_ts = events[-1]["timestamp"] if events else since_ts
-    c.execute("""
-        INSERT INTO metadata (key, value) VALUES ('last_event_ts', ?)
-        ON CONFLICT(key) DO UPDATE SET value = excluded.value
-    """, (latest_ts,))
+        c.execute("""
+            INSERT INTO metadata (key, value) VALUES ('last_event_ts', ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """, (latest_ts,))
+        c.execute(_STORE_ONLINE_COUNT_SQL)
 
-    conn.commit()
     print(f"[Worker] Processed {len(events)} player events")
 
 
 def cleanup_old_data(conn):
     """Remove old performance data to keep DB size manageable."""
     c = conn.cursor()
+    now = datetime.now(timezone.utc)
 
+    # Timestamps are ISO-8601 strings, which sort chronologically; comparing
+    # the raw column lets idx_perf_ts_cov / idx_events_ts do a range seek.
     # Delete performance data older than retention period
-    c.execute(f"""
-        DELETE FROM performance
-        WHERE strftime(
-            '%s',
-            replace(substr(timestamp, 1, 19), 'T', ' ')
-        ) < strftime('%s', 'now', '-{PERF_RETENTION_HOURS} hours')
-    """)
+    perf_cutoff = (now - timedelta(hours=PERF_RETENTION_HOURS)).isoformat()
+    c.execute("DELETE FROM performance WHERE timestamp < ?", (perf_cutoff,))
     deleted_perf = c.rowcount
 
     # Delete player events older than 7 days
-    c.execute("""
-        DELETE FROM player_events
-        WHERE timestamp < datetime('now', '-7 days')
-    """)
+    events_cutoff = (now - timedelta(days=7)).isoformat()
+    c.execute("DELETE FROM player_events WHERE timestamp < ?", (events_cutoff,))
     deleted_events = c.rowcount
 
+    # Always end the DELETEs' implicit transaction, even when nothing was
+    # removed: left open it would hold the write lock until some later
+    # commit, and the checkpoint below can't run inside it.
+    conn.commit()
     if deleted_perf > 0 or deleted_events > 0:
-        conn.commit()
         print(f"[Worker] Cleanup: removed {deleted_perf} perf records, {deleted_events} events")
 
     # Vacuum periodically to reclaim space
     c.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
 
-def initial_player_sync(conn):
-    """Initial sync of player data from logs on startup."""
-    print("[Worker] Initial player sync from logs...")
-
-    # Get logs for initial sync
-    if DOCKER_MODE and HYTALE_CONTAINER:
-        # Docker mode: get all available logs
-        cmd = ["docker", "logs", HYTALE_CONTAINER]
-        output, rc = run_cmd(cmd, timeout=60)
-    else:
-        # Native mode: get last 7 days
-        cmd = ["journalctl", "-u", SERVICE_NAME, "--no-pager", "-o", "short-iso", "--since", "7 days ago"]
-        output, rc = run_cmd(cmd, timeout=60)
+def begin_immediate(conn):
+    """Start a write transaction, taking the write lock up front.
 
-    if rc != 0:
-        print(f"[Worker] Failed to get logs: {output}")
-        return
+    sqlite3's legacy transaction handling opens implicit transactions for
+    DML; an earlier one still open would make BEGIN fail, so it is
+    committed first.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
 
-    events = parse_player_events(output)
 
-    # Process events to build current player state
+def fold_player_events(events) -> dict:
+    """Process events to build current player state, keyed by uuid."""
     players = {}
     for event in events:
         uuid = event["uuid"]
@@ -439,11 +837,44 @@ def initial_player_sync(conn):
         else:
             players[uuid]["online"] = False
             players[uuid]["last_logout"] = event["timestamp"]
+    return players
+
+
+def initial_player_sync(conn):
+    """Initial sync of player data from logs on startup."""
+    print("[Worker] Initial player sync from logs...")
 
-    # Save to database
+    # Get logs for initial sync
+    if _USE_DOCKER:
+        # Docker mode: get all available logs
+        cmd = ["docker", "logs", HYTALE_CONTAINER]
+    else:
+        # Native mode: get last 7 days
+        cmd = ["journalctl", "-u", SERVICE_NAME, "--no-pager", "-o", "short-iso", "--since", "7 days ago"]
+
+    # Stream the logs and fold events into the current player state as they
+    # are parsed; days of logs are never held in memory at once
+    try:
+        with stream_cmd(cmd, timeout=60) as proc:
+            players = fold_player_events(parse_player_events(proc.stdout))
+            rc = proc.wait()
+    except OSError as e:
+        print(f"[Worker] Failed to get logs: {e}")
+        return
+
+    if rc != 0:
+        print(f"[Worker] Failed to get logs (exit code {rc})")
+        return
+
+    # Save to database in one write transaction
+    rows = [
+        (p["uuid"], p["name"], 1 if p["online"] else 0, p["last_login"], p["last_logout"], p["world"])
+        for p in players.values()
+    ]
     c = conn.cursor()
-    for p in players.values():
-        c.execute("""
+    begin_immediate(conn)
+    with conn:
+        c.executemany("""
             INSERT INTO players (uuid, name, online, last_login, last_logout, world)
             VALUES (?, ?, ?, ?, ?, ?)
             ON CONFLICT(uuid) DO UPDATE SET
@@ -452,9 +883,9 @@ def initial_player_sync(conn):
                 last_login = COALESCE(excluded.last_login, players.last_login),
                 last_logout = COALESCE(excluded.last_logout, players.last_logout),
                 world = COALESCE(excluded.world, players.world)
-        """, (p["uuid"], p["name"], 1 if p["online"] else 0, p["last_login"], p["last_logout"], p["world"]))
+        """, rows)
+        c.execute(_STORE_ONLINE_COUNT_SQL)
 
-    conn.commit()
     print(f"[Worker] Synced {len(players)} players")
 
 
@@ -475,6 +906,10 @@ def main():
     conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
     conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes
     conn.execute("PRAGMA busy_timeout=10000")  # Wait up to 10s when DB is busy
+    conn.execute("PRAGMA mmap_size=268435456")  # Read pages via mmap (256 MiB)
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MiB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")  # Sorts/temp tables stay in RAM
+    conn.execute("PRAGMA wal_autocheckpoint=1000")  # Checkpoint every 1000 pages
 
     # Initial player sync
     initial_player_sync(conn)
@@ -518,9 +953,16 @@ def main():
             finally:
                 last_cleanup = now
 
-        # Sleep briefly to avoid busy loop
-        time.sleep(1)
+        # Sleep until the next task is due (or a shutdown signal arrives)
+        next_due = min(last_perf + PERF_INTERVAL, last_player + PLAYER_INTERVAL,
+                       last_cleanup + CLEANUP_INTERVAL)
+        _shutdown.wait(max(0.0, next_due - time.time()))
 
+    stop_log_follower()
+    try:
+        conn.execute("PRAGMA optimize")  # Refresh planner stats before exit
+    except sqlite3.Error as e:
+        print(f"[Worker] Optimize error: {e}")
     conn.close()
     print("[Worker] Shutdown complete")
 